@@ -78,14 +78,17 @@ if settings.SENTRY_DSN and not settings.DEBUG:
     )
 
 
+aiohttp_client_logger = logging.getLogger("aiohttp.client")
+
+
 async def on_request_end(session, context, params: TraceRequestEndParams) -> None:
     """Log all HTTP requests."""
     resp = params.response
 
-    # Format and send logging message.
+    # Format and send logging message. The query string is left out, as it can hold API secrets.
     protocol = f"HTTP/{resp.version.major}.{resp.version.minor}"
-    message = f'"{resp.method} - {protocol}" {resp.url} <{resp.status}>'
-    logging.getLogger('aiohttp.client').debug(message)
+    message = f'"{resp.method} - {protocol}" {resp.url.with_query(None)} <{resp.status}>'
+    aiohttp_client_logger.debug(message)
 
 
 # Configure aiohttp logging.
@@ -46,7 +46,7 @@ class Bot(DiscordBot):
         if self.http_session is None:
             logger.debug("Starting the HTTP session")
             self.http_session = ClientSession(
-                connector=TCPConnector(resolver=AsyncResolver(), family=socket.AF_INET), 
+                connector=TCPConnector(resolver=AsyncResolver(), family=socket.AF_INET, keepalive_timeout=75),
                 trace_configs=[trace_config]
             )
 
@@ -54,7 +54,7 @@ class Bot(DiscordBot):
         devlog_msg = f"Connected {constants.emojis.partying_face}"
         self.loop.create_task(self.send_log(devlog_msg, colour=constants.colours.bright_green))
 
-        logger.info(f"Started bot as {name}")
+        logger.info("Started bot as %s", name)
         print("Loading ScheduledTasks cog...")
         try:
             bot.load_extension("src.cmds.automation.scheduled_tasks")
@@ -64,7 +64,7 @@ class Bot(DiscordBot):
 
     async def on_application_command(self, ctx: ApplicationContext) -> None:
         """A global handler cog."""
-        logger.debug(f"Command '{ctx.command}' received.")
+        logger.debug("Command '%s' received.", ctx.command)
         received_commands.labels(ctx.command.name).inc()
         embed = Embed(title="Command Log")
         embed.add_field(name="Command", value=ctx.command.name, inline=True)
@@ -99,12 +99,12 @@ class Bot(DiscordBot):
         if message is None:
             raise error
         else:
-            logger.debug(f"A user caused an error which was handled.", exc_info=error)
+            logger.debug("A user caused an error which was handled.", exc_info=error)
             await ctx.respond(message, delete_after=15, ephemeral=True)
 
     async def on_application_command_completion(self, ctx: ApplicationContext) -> None:
         """A global cog handler."""
-        logger.debug(f"Command '{ctx.command}' completed.")
+        logger.debug("Command '%s' completed.", ctx.command)
         completed_commands.labels(ctx.command.name).inc()
 
     async def on_error(self, event: any, *args, **kwargs) -> None:
@@ -114,7 +114,7 @@ class Bot(DiscordBot):
     def add_cog(self, cog: Cog, *, override: bool = False) -> None:
         """Log whenever a cog is loaded."""
         super().add_cog(cog, override=override)
-        logger.debug(f"Cog loaded: {cog.qualified_name}")
+        logger.debug("Cog loaded: %s", cog.qualified_name)
 
     async def send_log(self, description: str = None, colour: int = None, embed: Embed = None) -> None:
         """Send an embed message to the devlog channel."""
@@ -122,15 +122,13 @@ class Bot(DiscordBot):
 
         if not devlog:
             logger.debug(
-                f"Fetching the devlog channel as it wasn't found in the cache "
-                f"(ID: {settings.channels.DEVLOG})"
+                "Fetching the devlog channel as it wasn't found in the cache (ID: %s)", settings.channels.DEVLOG
             )
             try:
                 devlog = await self.fetch_channel(settings.channels.DEVLOG)
             except HTTPException:
                 logger.debug(
-                    f"Could not fetch the devlog channel so log message won't be sent "
-                    f"(ID: {settings.channels.DEVLOG})"
+                    "Could not fetch the devlog channel so log message won't be sent (ID: %s)", settings.channels.DEVLOG
                 )
                 return
 
@@ -155,27 +153,22 @@ class Bot(DiscordBot):
         try:
             return await guild.fetch_member(id_)
         except Forbidden as exc:
-            logger.warning(f"Unauthorized attempt to fetch member with id: {id_}", exc_info=exc)
+            logger.warning("Unauthorized attempt to fetch member with id: %s", id_, exc_info=exc)
+            return None
         except NotFound as exc:
-            logger.warning(f"Could not find guild member with id: {id_}", exc_info=exc)
-            try:
-                return await self.get_or_fetch_user(id_)
-            except Forbidden as exc:
-                logger.warning(f"Unauthorized attempt to fetch member with id: {id_}", exc_info=exc)
-            except NotFound as exc:
-                logger.warning(f"Could not find guild member with id: {id_}", exc_info=exc)
-            except HTTPException as exc:
-                logger.error(f"Discord error while fetching guild member with id: {id_}", exc_info=exc)
+            logger.warning("Could not find guild member with id: %s", id_, exc_info=exc)
         except HTTPException as exc:
-            logger.error(f"Discord error while fetching guild member with id: {id_}", exc_info=exc)
-            try:
-                return await self.get_or_fetch_user(id_)
-            except Forbidden as exc:
-                logger.warning(f"Unauthorized attempt to fetch member with id: {id_}", exc_info=exc)
-            except NotFound as exc:
-                logger.warning(f"Could not find guild member with id: {id_}", exc_info=exc)
-            except HTTPException as exc:
-                logger.error(f"Discord error while fetching guild member with id: {id_}", exc_info=exc)
+            logger.error("Discord error while fetching guild member with id: %s", id_, exc_info=exc)
+
+        # Fall back to the user if the member could not be fetched from the guild.
+        try:
+            return await self.get_or_fetch_user(id_)
+        except Forbidden as exc:
+            logger.warning("Unauthorized attempt to fetch member with id: %s", id_, exc_info=exc)
+        except NotFound as exc:
+            logger.warning("Could not find guild member with id: %s", id_, exc_info=exc)
+        except HTTPException as exc:
+            logger.error("Discord error while fetching guild member with id: %s", id_, exc_info=exc)
 
         return None
 
@@ -35,7 +35,8 @@ class VerifyCog(commands.Cog):
         cert = await process_certification(certid, fullname)
         if cert:
             to_add = settings.get_cert(cert)
-            await ctx.author.add_roles(ctx.guild.get_role(to_add))
+            if ctx.author.get_role(to_add) is None:
+                await ctx.author.add_roles(ctx.guild.get_role(to_add))
             await ctx.respond(f"Added {cert}!", ephemeral=True)
         else:
             await ctx.respond("Unable to find certification with provided details", ephemeral=True)
@@ -4,7 +4,9 @@ from pathlib import Path
 from typing import Any, Optional
 
 import toml
-from pydantic import BaseSettings, validator
+from pydantic import BaseSettings, PrivateAttr, validator
+
+TOKEN_PATTERN = re.compile(r".{26}\..{6}\..{38}")
 
 
 class Bot(BaseSettings):
@@ -17,10 +19,9 @@ class Bot(BaseSettings):
     @validator("TOKEN")
     def check_token_format(cls, v: str) -> str:
         """Validate discord tokens format."""
-        pattern = re.compile(r".{26}\..{6}\..{38}")
-        assert pattern.fullmatch(
+        assert TOKEN_PATTERN.fullmatch(
             v
-        ), f"Discord token must follow >> {pattern.pattern} << pattern."
+        ), f"Discord token must follow >> {TOKEN_PATTERN.pattern} << pattern."
         return v
 
     class Config:
@@ -173,6 +174,13 @@ class Global(BaseSettings):
     roles_to_join: dict[str, tuple[int | str, str]] = {}
     role_groups: dict[str, list[int | str]] = {}
 
+    # Role lookups, built once in `load_settings`. Private, so they can't be set from the environment.
+    _academy_cert_roles: dict[int, int] = PrivateAttr(default_factory=dict)
+    _post_or_rank_roles: dict[str, int] = PrivateAttr(default_factory=dict)
+    _season_roles: dict[str, int] = PrivateAttr(default_factory=dict)
+    _cert_roles: dict[str, int] = PrivateAttr(default_factory=dict)
+    _role_group_ids: dict[str, frozenset[int]] = PrivateAttr(default_factory=dict)
+
     guild_ids: list[int]
     dev_guild_ids: list[int] = []
 
@@ -222,48 +230,20 @@ class Global(BaseSettings):
         return v
 
     def get_academy_cert_role(self, certificate: int) -> int:
-        return {
-            self.academy_certificates.CERTIFIED_BUG_BOUNTY_HUNTER: self.roles.ACADEMY_CBBH,
-            self.academy_certificates.CERTIFIED_PENETRATION_TESTING_SPECIALIST: self.roles.ACADEMY_CPTS,
-            self.academy_certificates.CERTIFIED_DEFENSIVE_SECURITY_ANALYST: self.roles.ACADEMY_CDSA,
-            self.academy_certificates.CERTIFIED_WEB_EXPLOITATION_EXPERT: self.roles.ACADEMY_CWEE,
-            self.academy_certificates.CERTIFIED_ACTIVEDIRECTORY_PENTESTING_EXPERT: self.roles.ACADEMY_CAPE
-        }.get(certificate)
+        return self._academy_cert_roles.get(certificate)
 
     def get_post_or_rank(self, what: str) -> Optional[int]:
-        return {
-            "1": self.roles.RANK_ONE,
-            "10": self.roles.RANK_TEN,
-            "Omniscient": self.roles.OMNISCIENT,
-            "Guru": self.roles.GURU,
-            "Elite Hacker": self.roles.ELITE_HACKER,
-            "Pro Hacker": self.roles.PRO_HACKER,
-            "Hacker": self.roles.HACKER,
-            "Script Kiddie": self.roles.SCRIPT_KIDDIE,
-            "Noob": self.roles.NOOB,
-            "vip": self.roles.VIP,
-            "dedivip": self.roles.VIP_PLUS,
-            "Challenge Creator": self.roles.CHALLENGE_CREATOR,
-            "Box Creator": self.roles.BOX_CREATOR,
-        }.get(what)
+        return self._post_or_rank_roles.get(what)
 
     def get_season(self, what: str):
-        return {
-            "Holo": self.roles.SEASON_HOLO,
-            "Platinum": self.roles.SEASON_PLATINUM,
-            "Ruby": self.roles.SEASON_RUBY,
-            "Silver": self.roles.SEASON_SILVER,
-            "Bronze": self.roles.SEASON_BRONZE,
-        }.get(what)
+        return self._season_roles.get(what)
 
     def get_cert(self, what: str):
-        return {
-            "CPTS": self.roles.ACADEMY_CPTS,
-            "CBBH": self.roles.ACADEMY_CBBH,
-            "CDSA": self.roles.ACADEMY_CDSA,
-            "CWEE": self.roles.ACADEMY_CWEE,
-            "CAPE": self.roles.ACADEMY_CAPE
-        }.get(what)
+        return self._cert_roles.get(what)
+
+    def get_role_group_ids(self, *names: str) -> frozenset[int]:
+        """Get the ids of all roles in the given role groups."""
+        return frozenset().union(*(self._role_group_ids.get(name, ()) for name in names))
 
     class Config:
         """The Pydantic settings configuration."""
@@ -348,6 +328,49 @@ def load_settings(env_file: str | None = None):
         ],
     }
 
+    global_settings._role_group_ids = {
+        name: frozenset(int(role_id) for role_id in role_ids) for name, role_ids in global_settings.role_groups.items()
+    }
+
+    roles = global_settings.roles
+    certificates = global_settings.academy_certificates
+    global_settings._academy_cert_roles = {
+        certificates.CERTIFIED_BUG_BOUNTY_HUNTER: roles.ACADEMY_CBBH,
+        certificates.CERTIFIED_PENETRATION_TESTING_SPECIALIST: roles.ACADEMY_CPTS,
+        certificates.CERTIFIED_DEFENSIVE_SECURITY_ANALYST: roles.ACADEMY_CDSA,
+        certificates.CERTIFIED_WEB_EXPLOITATION_EXPERT: roles.ACADEMY_CWEE,
+        certificates.CERTIFIED_ACTIVEDIRECTORY_PENTESTING_EXPERT: roles.ACADEMY_CAPE,
+    }
+    global_settings._post_or_rank_roles = {
+        "1": roles.RANK_ONE,
+        "10": roles.RANK_TEN,
+        "Omniscient": roles.OMNISCIENT,
+        "Guru": roles.GURU,
+        "Elite Hacker": roles.ELITE_HACKER,
+        "Pro Hacker": roles.PRO_HACKER,
+        "Hacker": roles.HACKER,
+        "Script Kiddie": roles.SCRIPT_KIDDIE,
+        "Noob": roles.NOOB,
+        "vip": roles.VIP,
+        "dedivip": roles.VIP_PLUS,
+        "Challenge Creator": roles.CHALLENGE_CREATOR,
+        "Box Creator": roles.BOX_CREATOR,
+    }
+    global_settings._season_roles = {
+        "Holo": roles.SEASON_HOLO,
+        "Platinum": roles.SEASON_PLATINUM,
+        "Ruby": roles.SEASON_RUBY,
+        "Silver": roles.SEASON_SILVER,
+        "Bronze": roles.SEASON_BRONZE,
+    }
+    global_settings._cert_roles = {
+        "CPTS": roles.ACADEMY_CPTS,
+        "CBBH": roles.ACADEMY_CBBH,
+        "CDSA": roles.ACADEMY_CDSA,
+        "CWEE": roles.ACADEMY_CWEE,
+        "CAPE": roles.ACADEMY_CAPE,
+    }
+
     return global_settings
 
 
@@ -9,10 +9,5 @@ logger = logging.getLogger(__name__)
 
 def member_is_staff(member: Member) -> bool:
     """Checks if a member has any of the Administrator or Moderator or Staff roles defined in the RoleIDs class."""
-    role_ids = set([role.id for role in member.roles])
-    staff_role_ids = (
-        set(settings.role_groups.get("ALL_ADMINS"))
-        | set(settings.role_groups.get("ALL_MODS"))
-        | set(settings.role_groups.get("ALL_HTB_STAFF"))
-    )
-    return bool(role_ids.intersection(staff_role_ids))
+    staff_role_ids = settings.get_role_group_ids("ALL_ADMINS", "ALL_MODS", "ALL_HTB_STAFF")
+    return any(role.id in staff_role_ids for role in member.roles)
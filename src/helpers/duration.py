@@ -5,6 +5,20 @@ import time
 
 logger = logging.getLogger(__name__)
 
+DURATION_PATTERN = re.compile(r"(-?(?:\d+\.?\d*|\d*\.?\d+)(?:e[-+]?\d+)?)\s*([a-z]*)", re.IGNORECASE)
+_MINUTE = 60
+_HOUR = _MINUTE * 60
+_DAY = _HOUR * 24
+DURATION_UNITS = {
+    "s": 1,
+    **dict.fromkeys(("m", "min", "mins"), _MINUTE),
+    **dict.fromkeys(("h", "hr", "hour", "hours"), _HOUR),
+    **dict.fromkeys(("d", "day", "days"), _DAY),
+    **dict.fromkeys(("wk", "w", "week", "weeks"), _DAY * 7),
+    **dict.fromkeys(("month", "months", "mo"), _DAY * 30),
+    **dict.fromkeys(("y", "yr", "year", "years"), _DAY * 365),
+}
+
 
 def validate_duration(duration: str, baseline_ts: int = None) -> (int, str):
     """Validate duration string and convert to seconds."""
@@ -26,23 +40,15 @@ def parse_duration_str(duration: str, baseline_ts: int = None) -> int | None:
 
     Example: "3w" to a timestamp in seconds since 1970/01/01 (UNIX epoch time).
     """
-    dur = re.compile(r"(-?(?:\d+\.?\d*|\d*\.?\d+)(?:e[-+]?\d+)?)\s*([a-z]*)", re.IGNORECASE)
-    units = {"s": 1}
-    units["m"] = units["min"] = units["mins"] = units["s"] * 60
-    units["h"] = units["hr"] = units["hour"] = units["hours"] = units["m"] * 60
-    units["d"] = units["day"] = units["days"] = units["h"] * 24
-    units["wk"] = units["w"] = units["week"] = units["weeks"] = units["d"] * 7
-    units["month"] = units["months"] = units["mo"] = units["d"] * 30
-    units["y"] = units["yr"] = units["year"] = units["years"] = units["d"] * 365
     sum_seconds = 0
 
     while duration:
-        m = dur.match(duration)
+        m = DURATION_PATTERN.match(duration)
         if not m:
             return None
         duration = duration[m.end():]
         try:
-            sum_seconds += int(m.groups()[0]) * units.get(m.groups()[1], 1)
+            sum_seconds += int(m.groups()[0]) * DURATION_UNITS.get(m.groups()[1], 1)
         except ValueError:
             return None
 
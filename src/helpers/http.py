@@ -0,0 +1,18 @@
+"""Helper methods to reuse HTTP sessions for outbound requests."""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from aiohttp import ClientSession
+
+from src.bot import bot
+
+
+@asynccontextmanager
+async def http_session() -> AsyncIterator[ClientSession]:
+    """Yield the shared HTTP session of the bot, or a short-lived session if it has not been started yet."""
+    if bot.http_session is not None and not bot.http_session.closed:
+        yield bot.http_session
+        return
+
+    async with ClientSession() as session:
+        yield session
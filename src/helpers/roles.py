@@ -0,0 +1,84 @@
+"""Helper methods to handle role updates of guild members."""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Iterable
+
+import discord
+from discord import Forbidden, HTTPException, Member
+
+logger = logging.getLogger(__name__)
+
+# Role updates queued for the same member within this window (in seconds) are applied with a single request.
+ROLE_UPDATE_DELAY = 0.5
+# Maximum number of role updates sent to Discord at the same time for a guild.
+ROLE_UPDATE_CONCURRENCY = 8
+
+_pending_role_updates: dict[int, tuple[Member, set[int], set[int], list[str], asyncio.Task]] = {}
+_role_update_tasks: set[asyncio.Task] = set()
+_member_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+_updated_members: dict[int, Member] = {}
+_guild_semaphores: defaultdict[int, asyncio.Semaphore] = defaultdict(
+    lambda: asyncio.Semaphore(ROLE_UPDATE_CONCURRENCY)
+)
+
+
+async def update_member_roles(
+    member: Member, add: Iterable[int] = (), remove: Iterable[int] = (), reason: str | None = None
+) -> None:
+    """
+    Add roles to and remove roles from a member.
+
+    Updates for the same member made within `ROLE_UPDATE_DELAY` seconds are merged, the latest update winning
+    when a role is both added and removed, and applied together with a single request. Merged updates of the same
+    member are applied one after the other. Returns once the merged update has been applied, raising the error of
+    the request if it failed.
+    """
+    add, remove = set(add), set(remove)
+    reasons = []
+    if member.id in _pending_role_updates:
+        _, to_add, to_remove, reasons, task = _pending_role_updates[member.id]
+        add |= to_add - remove
+        remove |= to_remove - add
+    else:
+        task = asyncio.create_task(_apply_role_updates(member.id))
+        # Keep a reference to the task until it is done, so it is not garbage collected while it runs.
+        _role_update_tasks.add(task)
+        task.add_done_callback(_role_update_tasks.discard)
+    if reason and reason not in reasons:
+        reasons.append(reason)
+    _pending_role_updates[member.id] = (member, add, remove, reasons, task)
+
+    # Shielded, so that a cancelled caller does not cancel the update for the other callers.
+    await asyncio.shield(task)
+
+
+async def _apply_role_updates(member_id: int) -> None:
+    await asyncio.sleep(ROLE_UPDATE_DELAY)
+    # The roles are read and replaced under the lock, so that an update never overwrites the one before it.
+    async with _member_locks[member_id]:
+        try:
+            member, to_add, to_remove, reasons, _ = _pending_role_updates.pop(member_id)
+            # The member returned by the previous update is newer than the guild's member cache, which is only updated
+            # once Discord sends the change through the gateway. Otherwise, the roles are read from the cache right
+            # before the request, so that roles given to the member in the meantime are kept.
+            member = _updated_members.pop(member_id, None) or member.guild.get_member(member_id) or member
+            current_role_ids = {role.id for role in member.roles if not role.is_default()}
+            role_ids = (current_role_ids - to_remove) | to_add
+            if role_ids == current_role_ids:
+                logger.debug("Roles of member %s are already up to date", member_id)
+            else:
+                async with _guild_semaphores[member.guild.id]:
+                    roles = [discord.Object(id=role_id) for role_id in role_ids]
+                    try:
+                        member = await member.edit(roles=roles, reason="; ".join(reasons) or None) or member
+                    except (Forbidden, HTTPException) as exc:
+                        logger.error("Could not update the roles of member %s", member_id, exc_info=exc)
+                        raise
+
+            if member_id in _pending_role_updates:
+                # Hand the member over to the next update, which is waiting for the lock.
+                _updated_members[member_id] = member
+        finally:
+            if member_id not in _pending_role_updates:
+                del _member_locks[member_id]
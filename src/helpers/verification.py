@@ -1,8 +1,8 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, cast
 
-import aiohttp
 import discord
 from discord import Forbidden, Member, Role, User
 from discord.ext.commands import GuildNotFound, MemberNotFound
@@ -10,15 +10,28 @@ from discord.ext.commands import GuildNotFound, MemberNotFound
 from src.bot import Bot
 from src.core import settings
 from src.helpers.ban import ban_member
+from src.helpers.http import http_session
+from src.helpers.roles import update_member_roles
 
 logger = logging.getLogger(__name__)
 
+# HTB ranks that don't have a rank role of their own.
+RANKS_WITHOUT_ROLE = frozenset({"Deleted", "Moderator", "Ambassador", "Admin", "Staff"})
+
+CERTIFICATE_ABBREVIATIONS = {
+    "HTB Certified Bug Bounty Hunter": "CBBH",
+    "HTB Certified Penetration Testing Specialist": "CPTS",
+    "HTB Certified Defensive Security Analyst": "CDSA",
+    "HTB Certified Web Exploitation Expert": "CWEE",
+    "HTB Certified Active Directory Pentesting Expert": "CAPE",
+}
+
 
 async def get_user_details(account_identifier: str) -> Optional[Dict]:
     """Get user details from HTB."""
     acc_id_url = f"{settings.API_URL}/discord/identifier/{account_identifier}?secret={settings.HTB_API_SECRET}"
 
-    async with aiohttp.ClientSession() as session:
+    async with http_session() as session:
         async with session.get(acc_id_url) as r:
             if r.status == 200:
                 response = await r.json()
@@ -26,7 +39,7 @@ async def get_user_details(account_identifier: str) -> Optional[Dict]:
                 logger.debug("Account identifier has been regenerated since last identification. Cannot re-verify.")
                 response = None
             else:
-                logger.error(f"Non-OK HTTP status code returned from identifier lookup: {r.status}.")
+                logger.error("Non-OK HTTP status code returned from identifier lookup: %s.", r.status)
                 response = None
 
     return response
@@ -37,7 +50,7 @@ async def get_season_rank(htb_uid: int) -> str | None:
     headers = {"Authorization": f"Bearer {settings.HTB_API_KEY}"}
     season_api_url = f"{settings.API_V4_URL}/season/end/{settings.SEASON_ID}/{htb_uid}"
 
-    async with aiohttp.ClientSession() as session:
+    async with http_session() as session:
         async with session.get(season_api_url, headers=headers) as r:
             if r.status == 200:
                 response = await r.json()
@@ -45,7 +58,7 @@ async def get_season_rank(htb_uid: int) -> str | None:
                 logger.error("Invalid Season ID.")
                 response = None
             else:
-                logger.error(f"Non-OK HTTP status code returned from identifier lookup: {r.status}.")
+                logger.error("Non-OK HTTP status code returned from identifier lookup: %s.", r.status)
                 response = None
 
     if not response["data"]:
@@ -60,15 +73,15 @@ async def get_season_rank(htb_uid: int) -> str | None:
 
 
 async def _check_for_ban(uid: str) -> Optional[Dict]:
-    async with aiohttp.ClientSession() as session:
+    async with http_session() as session:
         token_url = f"{settings.API_URL}/discord/{uid}/banned?secret={settings.HTB_API_SECRET}"
         async with session.get(token_url) as r:
             if r.status == 200:
                 ban_details = await r.json()
             else:
                 logger.error(
-                    f"Could not fetch ban details for uid {uid}: "
-                    f"non-OK status code returned ({r.status}). Body: {r.content}"
+                    "Could not fetch ban details for uid %s: non-OK status code returned (%s). Body: %s",
+                    uid, r.status, r.content,
                 )
                 ban_details = None
 
@@ -79,32 +92,20 @@ async def process_certification(certid: str, name: str):
     """Process certifications."""
     cert_api_url = f"{settings.API_V4_URL}/certificate/lookup"
     params = {'id': certid, 'name': name}
-    async with aiohttp.ClientSession() as session:
+    async with http_session() as session:
         async with session.get(cert_api_url, params=params) as r:
             if r.status == 200:
                 response = await r.json()
             elif r.status == 404:
                 return False
             else:
-                logger.error(f"Non-OK HTTP status code returned from identifier lookup: {r.status}.")
+                logger.error("Non-OK HTTP status code returned from identifier lookup: %s.", r.status)
                 response = None
     try:
         certRawName = response["certificates"][0]["name"]
     except IndexError:
         return False
-    if certRawName == "HTB Certified Bug Bounty Hunter":
-        cert = "CBBH"
-    elif certRawName == "HTB Certified Penetration Testing Specialist":
-        cert = "CPTS"
-    elif certRawName == "HTB Certified Defensive Security Analyst":
-        cert = "CDSA"
-    elif certRawName == "HTB Certified Web Exploitation Expert":
-        cert = "CWEE"
-    elif certRawName == "HTB Certified Active Directory Pentesting Expert":
-        cert = "CAPE"
-    else:
-        cert = False
-    return cert
+    return CERTIFICATE_ABBREVIATIONS.get(certRawName, False)
 
 
 async def process_identification(
@@ -123,8 +124,8 @@ async def process_identification(
             raise MemberNotFound(str(user.id))
     else:
         raise GuildNotFound(f"Could not identify member {user} in guild.")
-    season_rank = await get_season_rank(htb_uid)
-    banned_details = await _check_for_ban(htb_uid)
+    # Both lookups are independent requests to HTB, so run them concurrently
+    season_rank, banned_details = await asyncio.gather(get_season_rank(htb_uid), _check_for_ban(htb_uid))
 
     if banned_details is not None and banned_details["banned"]:
         # If user is banned, this field must be a string
@@ -133,7 +134,7 @@ async def process_identification(
         banned_until_dt: datetime = datetime.strptime(banned_until, "%Y-%m-%d")
         ban_duration: str = f"{(banned_until_dt - datetime.now()).days}d"
         reason = "Banned on the HTB Platform. Please contact HTB Support to appeal."
-        logger.info(f"Discord user {member.name} ({member.id}) is platform banned. Banning from Discord...")
+        logger.info("Discord user %s (%s) is platform banned. Banning from Discord...", member.name, member.id)
         await ban_member(bot, guild, member, ban_duration, reason, None, needs_approval=False)
 
         embed = discord.Embed(
@@ -144,81 +145,76 @@ async def process_identification(
         await guild.get_channel(settings.channels.VERIFY_LOGS).send(embed=embed)
         return None
 
-    to_remove = []
-
-    for role in member.roles:
-        if role.id in settings.role_groups.get("ALL_RANKS") + settings.role_groups.get("ALL_POSITIONS"):
-            to_remove.append(guild.get_role(role.id))
-
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     to_assign = []
-    logger.debug(
-        "Getting role 'rank':", extra={
-            "role_id": settings.get_post_or_rank(htb_user_details["rank"]),
-            "role_obj": guild.get_role(settings.get_post_or_rank(htb_user_details["rank"])),
-            "htb_rank": htb_user_details["rank"],
-        }, )
-    if htb_user_details["rank"] not in ["Deleted", "Moderator", "Ambassador", "Admin", "Staff"]:
-        to_assign.append(guild.get_role(settings.get_post_or_rank(htb_user_details["rank"])))
+    rank_role_id = settings.get_post_or_rank(htb_user_details["rank"])
+    rank_role = guild.get_role(rank_role_id)
+    if debug_enabled:
+        logger.debug(
+            "Getting role 'rank':", extra={
+                "role_id": rank_role_id, "role_obj": rank_role, "htb_rank": htb_user_details["rank"],
+            }, )
+    if htb_user_details["rank"] not in RANKS_WITHOUT_ROLE:
+        to_assign.append(rank_role)
     if season_rank:
         to_assign.append(guild.get_role(settings.get_season(season_rank)))
     if htb_user_details["vip"]:
-        logger.debug(
-            'Getting role "VIP":', extra={"role_id": settings.roles.VIP, "role_obj": guild.get_role(settings.roles.VIP)}
-        )
-        to_assign.append(guild.get_role(settings.roles.VIP))
+        vip_role = guild.get_role(settings.roles.VIP)
+        if debug_enabled:
+            logger.debug('Getting role "VIP":', extra={"role_id": settings.roles.VIP, "role_obj": vip_role})
+        to_assign.append(vip_role)
     if htb_user_details["dedivip"]:
-        logger.debug(
-            'Getting role "VIP+":',
-            extra={"role_id": settings.roles.VIP_PLUS, "role_obj": guild.get_role(settings.roles.VIP_PLUS)}
-        )
-        to_assign.append(guild.get_role(settings.roles.VIP_PLUS))
+        vip_plus_role = guild.get_role(settings.roles.VIP_PLUS)
+        if debug_enabled:
+            logger.debug('Getting role "VIP+":', extra={"role_id": settings.roles.VIP_PLUS, "role_obj": vip_plus_role})
+        to_assign.append(vip_plus_role)
     if htb_user_details["hof_position"] != "unranked":
         position = int(htb_user_details["hof_position"])
-        pos_top = None
+        hof_role_id = None
         if position == 1:
-            pos_top = "1"
+            hof_role_id = settings.roles.RANK_ONE
         elif position <= 10:
-            pos_top = "10"
-        if pos_top:
-            logger.debug(f"User is Hall of Fame rank {position}. Assigning role Top-{pos_top}...")
-            logger.debug(
-                'Getting role "HoF role":', extra={
-                    "role_id": settings.get_post_or_rank(pos_top),
-                    "role_obj": guild.get_role(settings.get_post_or_rank(pos_top)), "hof_val": pos_top,
-                }, )
-            to_assign.append(guild.get_role(settings.get_post_or_rank(pos_top)))
+            hof_role_id = settings.roles.RANK_TEN
+        if hof_role_id:
+            logger.debug("User is Hall of Fame rank %s. Assigning role %s...", position, hof_role_id)
+            hof_role = guild.get_role(hof_role_id)
+            if debug_enabled:
+                logger.debug('Getting role "HoF role":', extra={"role_id": hof_role_id, "role_obj": hof_role})
+            to_assign.append(hof_role)
         else:
-            logger.debug(f"User is position {position}. No Hall of Fame roles for them.")
+            logger.debug("User is position %s. No Hall of Fame roles for them.", position)
     if htb_user_details["machines"]:
-        logger.debug(
-            'Getting role "BOX_CREATOR":',
-            extra={"role_id": settings.roles.BOX_CREATOR, "role_obj": guild.get_role(settings.roles.BOX_CREATOR)}, )
-        to_assign.append(guild.get_role(settings.roles.BOX_CREATOR))
+        box_creator_role = guild.get_role(settings.roles.BOX_CREATOR)
+        if debug_enabled:
+            logger.debug(
+                'Getting role "BOX_CREATOR":',
+                extra={"role_id": settings.roles.BOX_CREATOR, "role_obj": box_creator_role},
+            )
+        to_assign.append(box_creator_role)
     if htb_user_details["challenges"]:
-        logger.debug(
-            'Getting role "CHALLENGE_CREATOR":', extra={
-                "role_id": settings.roles.CHALLENGE_CREATOR,
-                "role_obj": guild.get_role(settings.roles.CHALLENGE_CREATOR),
-            }, )
-        to_assign.append(guild.get_role(settings.roles.CHALLENGE_CREATOR))
+        challenge_creator_role = guild.get_role(settings.roles.CHALLENGE_CREATOR)
+        if debug_enabled:
+            logger.debug(
+                'Getting role "CHALLENGE_CREATOR":',
+                extra={"role_id": settings.roles.CHALLENGE_CREATOR, "role_obj": challenge_creator_role},
+            )
+        to_assign.append(challenge_creator_role)
 
     if member.nick != htb_user_details["user_name"]:
         try:
             await member.edit(nick=htb_user_details["user_name"])
         except Forbidden as e:
-            logger.error(f"Exception whe trying to edit the nick-name of the user: {e}")
+            logger.error("Exception whe trying to edit the nick-name of the user: %s", e)
 
-    logger.debug("All roles to_assign:", extra={"to_assign": to_assign})
+    if debug_enabled:
+        logger.debug("All roles to_assign:", extra={"to_assign": to_assign})
+    rank_role_ids = settings.get_role_group_ids("ALL_RANKS", "ALL_POSITIONS")
+    role_ids_to_add = {role.id for role in to_assign if role is not None}
     # We don't need to remove any roles that are going to be assigned again
-    to_remove = list(set(to_remove) - set(to_assign))
-    logger.debug("All roles to_remove:", extra={"to_remove": to_remove})
-    if to_remove:
-        await member.remove_roles(*to_remove, atomic=True)
-    else:
-        logger.debug("No roles need to be removed")
-    if to_assign:
-        await member.add_roles(*to_assign, atomic=True)
-    else:
-        logger.debug("No roles need to be assigned")
+    role_ids_to_remove = rank_role_ids - role_ids_to_add
+    if debug_enabled:
+        logger.debug("All role ids to_remove:", extra={"to_remove": role_ids_to_remove})
+    # Roles the member already has, or doesn't have, are left as they are
+    await update_member_roles(member, add=role_ids_to_add, remove=role_ids_to_remove, reason="Identification")
 
     return to_assign
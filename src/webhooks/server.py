@@ -3,6 +3,9 @@ import logging
 from typing import Any, Dict, Union
 
 from fastapi import FastAPI, HTTPException, Header
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from uvicorn import Config, Server
 
 from src.bot import bot
@@ -15,6 +18,54 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI()
 
+# Webhook payloads are small, requests with a larger body are rejected.
+MAX_BODY_SIZE = 64 * 1024
+
+# Encoded once, so requests are compared as bytes without re-encoding the token.
+_webhook_token = settings.WEBHOOK_TOKEN.encode()
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject requests with a body larger than `MAX_BODY_SIZE`.
+
+    Requests which announce a larger body in their Content-Length header are rejected before it is read. The body
+    of every other request, chunked or not, is counted as it is received and the request is rejected once the
+    body gets too large.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > MAX_BODY_SIZE:
+            logger.warning("Rejected request with a body of %s bytes", content_length)
+            response = JSONResponse(status_code=413, content={"detail": "Request body too large"})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > MAX_BODY_SIZE:
+                    logger.warning("Rejected request with a body of more than %s bytes", MAX_BODY_SIZE)
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+app.add_middleware(BodySizeLimitMiddleware)
+
 
 @app.post("/webhook")
 async def webhook_handler(body: WebhookBody, authorization: Union[str, None] = Header(default=None)) -> Dict[str, Any]:
@@ -40,8 +91,8 @@ async def webhook_handler(body: WebhookBody, authorization: Union[str, None] = H
         logger.warning("Unauthorized webhook request")
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    token = authorization[6:].strip()
-    if hmac.compare_digest(token, settings.WEBHOOK_TOKEN):
+    token = authorization[6:].strip().encode()
+    if not _webhook_token or not hmac.compare_digest(token, _webhook_token):
         logger.warning("Unauthorized webhook request")
         raise HTTPException(status_code=401, detail="Unauthorized")
 
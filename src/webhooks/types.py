@@ -1,9 +1,10 @@
-from enum import Enum
+from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 
 
-class WebhookEvent(Enum):
+class WebhookEvent(StrEnum):
     ACCOUNT_LINKED = "AccountLinked"
     ACCOUNT_UNLINKED = "AccountUnlinked"
     CERTIFICATE_AWARDED = "CertificateAwarded"
@@ -14,7 +15,7 @@ class WebhookEvent(Enum):
     NAME_CHANGE = "NameChange"
 
 
-class Platform(Enum):
+class Platform(StrEnum):
     MAIN = "mp"
     ACADEMY = "academy"
     CTF = "ctf"
@@ -24,4 +25,18 @@ class Platform(Enum):
 class WebhookBody(BaseModel):
     platform: Platform
     event: WebhookEvent
-    data: dict
+    data: dict[str, Any]
+
+    @validator("data")
+    def check_discord_id(cls, v: dict) -> dict:
+        """Validate that the data contains a numeric Discord ID."""
+        try:
+            v["discord_id"] = int(v["discord_id"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Invalid Discord ID")
+        return v
+
+    class Config:
+        """The Pydantic model configuration."""
+
+        allow_mutation = False
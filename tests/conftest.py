@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -6,6 +7,14 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from tests import helpers
 
 
+@pytest.fixture(scope="session")
+def event_loop():
+    # One event loop for the whole test session instead of a new loop for every test.
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 @pytest.fixture
 def hashable_mocks():
     return helpers.MockRole, helpers.MockMember, helpers.MockGuild
@@ -16,9 +25,28 @@ def bot():
     return helpers.MockBot()
 
 
+@pytest.fixture(scope="session")
+def shared_bot():
+    return helpers.MockBot()
+
+
+@pytest.fixture
+def setup_bot(shared_bot):
+    # The bot is shared by all tests that only load a cog, so the calls of the previous test are reset.
+    shared_bot.reset_mock()
+    return shared_bot
+
+
+@pytest.fixture(scope="session")
+def shared_respond():
+    return AsyncMock()
+
+
 @pytest.fixture
-def ctx():
-    return helpers.MockContext()
+def ctx(shared_respond):
+    # The respond mock is shared by all tests, so what the previous test configured and recorded is reset.
+    shared_respond.reset_mock(return_value=True, side_effect=True)
+    return helpers.MockContext(respond=shared_respond)
 
 
 @pytest.fixture
@@ -41,6 +69,16 @@ def author():
     return helpers.MockMember()
 
 
+@pytest.fixture
+def mod_user():
+    return helpers.MockMember(id=1, name="Test User")
+
+
+@pytest.fixture
+def banned_user():
+    return helpers.MockMember(id=2, name="Banned User")
+
+
 @pytest.fixture
 def guild():
     # Create and return a mocked instance of the Guild class
@@ -57,8 +95,8 @@ def content():
     return 297552404041814548  # Randomly generated id.
 
 
-@pytest.fixture
-def session(mocker):
+@pytest.fixture(scope="session")
+def shared_session():
     class AsyncContextManager:
         async def __aenter__(self):
             return session
@@ -70,6 +108,15 @@ def session(mocker):
     session = AsyncMock(spec=AsyncSession)
 
     # Mock the async_sessionmaker
-    async_sessionmaker_mock = mocker.MagicMock(spec=async_sessionmaker)
+    async_sessionmaker_mock = Mock(spec=async_sessionmaker)
     async_sessionmaker_mock.return_value = AsyncContextManager()
+    return async_sessionmaker_mock, session
+
+
+@pytest.fixture
+def session(shared_session):
+    # The session maker is shared by all tests, so what the previous test configured and recorded is reset.
+    async_sessionmaker_mock, session = shared_session
+    session.reset_mock(return_value=True, side_effect=True)
+    async_sessionmaker_mock.reset_mock()
     return async_sessionmaker_mock
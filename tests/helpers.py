@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import functools
 import itertools
+import operator
 from asyncio import AbstractEventLoop
-from collections import ChainMap, defaultdict
-from typing import Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Optional, Union
 from unittest import mock
 
 import discord
@@ -11,9 +12,9 @@ import discord.mixins
 from aiohttp import ClientSession
 from discord import Interaction
 from discord.commands import ApplicationContext
-from discord.types.member import MemberWithUser
 
-from src.bot import Bot
+if TYPE_CHECKING:
+    from src.bot import Bot
 
 
 class HashableMixin(discord.mixins.EqualityComparable):
@@ -56,6 +57,13 @@ class ColourMixin:
         self.accent_colour = color
 
 
+# The attributes set by `Mock._mock_add_spec`, by the id of the `spec_set` of our custom mock classes and their
+# additional async and instance attributes.
+_spec_cache: dict[tuple[int, Optional[tuple[str, ...]], tuple[str, ...]], dict[str, Any]] = {}
+# The attributes `Mock._mock_add_spec` is expected to set, without which the spec is not cached.
+_CACHED_SPEC_ATTRIBUTES = frozenset({'_spec_class', '_spec_set', '_spec_signature', '_mock_methods', '_spec_asyncs'})
+
+
 class CustomMockMixin:
     """
     Provides common functionality for our custom Mock types.
@@ -63,9 +71,10 @@ class CustomMockMixin:
     The `_get_child_mock` method automatically returns an AsyncMock for coroutine methods of the mock
     object. As discord.py also uses synchronous methods that nonetheless return coroutine objects, the
     class attribute `additional_spec_asyncs` can be overwritten with an iterable containing additional
-    attribute names that also should be mocked with an AsyncMock instead of a regular MagicMock/Mock. The
-    class method `spec_set` can be overwritten with the object that should be uses as the specification
-    for the mock.
+    attribute names that also should be mocked with an AsyncMock instead of a regular MagicMock/Mock.
+    Likewise, `additional_spec_attributes` names attributes that are only set on instances of the
+    `spec_set` class and are therefore missing from a spec taken from the class. The class method
+    `spec_set` can be overwritten with the object that should be uses as the specification for the mock.
 
     Mock/MagicMock subclasses that use this mixin only need to define `__init__` method if they need to
     implement custom behavior.
@@ -75,17 +84,55 @@ class CustomMockMixin:
     discord_id = itertools.count(0)
     spec_set = None
     additional_spec_asyncs = None
+    additional_spec_attributes = ()
+    # Default keyword arguments that are the same for every mock, so they are only built once per class.
+    static_defaults: dict[str, Any] = {}
 
     def __init__(self, **kwargs):
         name = kwargs.pop('name', None)  # `name` has special meaning for Mock classes, so we need to set it manually.
         super().__init__(spec_set=self.spec_set, **kwargs)
 
-        if self.additional_spec_asyncs:
-            self._spec_asyncs.extend(self.additional_spec_asyncs)
-
         if name:
             self.name = name
 
+    @classmethod
+    def next_ids(cls, n: int) -> list[int]:
+        """Reserve `n` unique ids at once, e.g. to create many mocks of the same type."""
+        return list(itertools.islice(cls.discord_id, n))
+
+    def _mock_add_spec(self, spec, *args, **kwargs) -> None:
+        """
+        Overwrite of the `_mock_add_spec` method to cache the introspection of our `spec_set` classes.
+
+        `Mock` walks every attribute of the spec whenever a mock is created, which is the bulk of the cost of
+        creating one of our custom mocks. As `spec_set` is the same object for all instances of a class, the
+        attributes set for the first instance, including the additional async and instance attributes of the
+        class, are cached and copied onto every later instance.
+        """
+        if spec is None or spec is not self.spec_set:
+            return super()._mock_add_spec(spec, *args, **kwargs)
+
+        cache_key = (id(spec), self.additional_spec_asyncs, self.additional_spec_attributes)
+        cached = _spec_cache.get(cache_key)
+        if cached is not None:
+            self.__dict__.update(cached)
+            return
+
+        before = dict(self.__dict__)
+        super()._mock_add_spec(spec, *args, **kwargs)
+        added = {key: value for key, value in self.__dict__.items() if key not in before or before[key] is not value}
+        if '_spec_asyncs' in added:
+            # `_get_child_mock` checks every attribute that is accessed against this, so use a set instead of a list.
+            added['_spec_asyncs'] = frozenset(added['_spec_asyncs']).union(self.additional_spec_asyncs or ())
+        if self.additional_spec_attributes and added.get('_mock_methods') is not None:
+            added['_mock_methods'] = [*added['_mock_methods'], *self.additional_spec_attributes]
+        self.__dict__.update(added)
+
+        # These are private attributes of `Mock`, which may change between Python versions. If the spec isn't kept
+        # in them, copying it is not known to be safe, so every instance introspects the spec itself instead.
+        if _CACHED_SPEC_ATTRIBUTES <= added.keys():
+            _spec_cache[cache_key] = added
+
     def _get_child_mock(self, **kwargs) -> Union[mock.MagicMock, mock.AsyncMock]:
         """
         Overwrite of the `_get_child_mock` method to stop the propagation of our custom mock classes.
@@ -99,7 +146,7 @@ class CustomMockMixin:
         This override will look for an attribute called `child_mock_type` and use that as the type of the child mock.
         """
         _new_name = kwargs.get("_new_name")
-        if _new_name in self.__dict__['_spec_asyncs']:
+        if _new_name in self.__dict__.get('_spec_asyncs', ()):
             return mock.AsyncMock(**kwargs)
 
         _type = type(self)
@@ -117,28 +164,8 @@ class CustomMockMixin:
         return klass(**kwargs)
 
 
-# Create a guild instance to get a realistic Mock of `discord.Guild`
-guild_data = {
-    'id': 1,
-    'name': 'guild',
-    'verification_level': 2,
-    'default_notications': 1,
-    'afk_timeout': 100,
-    'icon': "icon.png",
-    'banner': 'banner.png',
-    'mfa_level': 1,
-    'splash': 'splash.png',
-    'system_channel_id': 464033278631084042,
-    'description': 'mocking is fun',
-    'max_presences': 10_000,
-    'max_members': 100_000,
-    'preferred_locale': 'UTC',
-    'owner_id': 1,
-    'afk_channel_id': 464033278631084042,
-}
-guild_instance = discord.Guild(data=guild_data, state=mock.MagicMock())
-
-
+# The discord models use `__slots__`, so specs built from the classes know every attribute of an instance
+# without having to parse fake data into real instances at import.
 class MockGuild(CustomMockMixin, mock.Mock, HashableMixin):
     """
     A `Mock` subclass to mock `discord.Guild` objects.
@@ -153,22 +180,19 @@ class MockGuild(CustomMockMixin, mock.Mock, HashableMixin):
     the mocked object. To get around that, you can set the non-standard attribute explicitly for the
     instance of `MockGuild`:
     """
-    spec_set = guild_instance
+    spec_set = discord.Guild
     additional_spec_asyncs = None
 
     def __init__(self, roles: Optional[Iterable[MockRole]] = None, **kwargs) -> None:
         default_kwargs = {'id': next(self.discord_id), 'members': []}
-        super().__init__(**ChainMap(kwargs, default_kwargs))
+        super().__init__(**(default_kwargs | kwargs))
 
         self.roles = [MockRole(name="@everyone", position=1, id=0)]
         if roles:
             self.roles.extend(roles)
 
 
-# Create a Role instance to get a realistic Mock of `discord.Role`
-role_data = {'name': 'role', 'id': 1}
-# noinspection PyTypeChecker
-role_instance = discord.Role(guild=guild_instance, state=mock.MagicMock(), data=role_data)
+DEFAULT_ROLE_COLOUR = discord.Colour(0xdeadbf)
 
 
 class MockRole(CustomMockMixin, mock.Mock, ColourMixin, HashableMixin):
@@ -178,17 +202,15 @@ class MockRole(CustomMockMixin, mock.Mock, ColourMixin, HashableMixin):
     Instances of this class will follow the specifications of `discord.Role` instances. For more
     information, see the `MockGuild` docstring.
     """
-    spec_set = role_instance
+    spec_set = discord.Role
+    static_defaults = {'name': 'role', 'position': 1, 'colour': DEFAULT_ROLE_COLOUR}
 
     def __init__(self, **kwargs) -> None:
-        default_kwargs = {
-            'id': next(self.discord_id),
-            'name': 'role',
-            'position': 1,
-            'colour': discord.Colour(0xdeadbf),
-            'permissions': discord.Permissions(),
-        }
-        super().__init__(**ChainMap(kwargs, default_kwargs))
+        default_kwargs = self.static_defaults | {'id': next(self.discord_id)}
+        # `discord.Permissions` can be changed in place, so every role gets its own default instance.
+        if 'permissions' not in kwargs:
+            default_kwargs['permissions'] = discord.Permissions()
+        super().__init__(**(default_kwargs | kwargs))
 
         if isinstance(self.colour, int):
             self.colour = discord.Colour(self.colour)
@@ -208,12 +230,6 @@ class MockRole(CustomMockMixin, mock.Mock, ColourMixin, HashableMixin):
         return self.position >= other.position
 
 
-# Create a Member instance to get a realistic Mock of `discord.Member`
-member_data = {'user': 'lemon', 'roles': [1]}
-state_mock = mock.MagicMock()
-member_instance = discord.Member(data=MemberWithUser(**member_data), guild=guild_instance, state=state_mock)
-
-
 class MockMember(CustomMockMixin, mock.Mock, ColourMixin, HashableMixin):
     """
     A Mock subclass to mock Member objects.
@@ -221,27 +237,24 @@ class MockMember(CustomMockMixin, mock.Mock, ColourMixin, HashableMixin):
     Instances of this class will follow the specifications of `discord.Member` instances. For more
     information, see the `MockGuild` docstring.
     """
-    spec_set = member_instance
+    spec_set = discord.Member
+    static_defaults = {'name': 'member', 'bot': False, 'pending': False}
 
     def __init__(self, roles: Optional[Iterable[MockRole]] = None, **kwargs) -> None:
-        default_kwargs = {'name': 'member', 'id': next(self.discord_id), 'bot': False, "pending": False}
-        super().__init__(**ChainMap(kwargs, default_kwargs))
+        default_kwargs = self.static_defaults | {'id': next(self.discord_id)}
+        super().__init__(**(default_kwargs | kwargs))
 
         self.roles = [MockRole(name="@everyone", position=1, id=0)]
         if roles:
             self.roles.extend(roles)
-        self.top_role = max(self.roles)
 
         if 'mention' not in kwargs:
             self.mention = f"@{self.name}"
 
-
-# Create a User instance to get a realistic Mock of `discord.User`
-_user_data_mock = defaultdict(mock.MagicMock)
-user_instance = discord.User(
-    data=mock.MagicMock(get=mock.Mock(side_effect=_user_data_mock.get)),
-    state=mock.MagicMock()
-)
+    @functools.cached_property
+    def top_role(self) -> MockRole:
+        """The role with the highest position, only looked up when used."""
+        return max(self.roles, key=operator.attrgetter('position'))
 
 
 class MockUser(CustomMockMixin, mock.Mock, ColourMixin, HashableMixin):
@@ -251,11 +264,12 @@ class MockUser(CustomMockMixin, mock.Mock, ColourMixin, HashableMixin):
     Instances of this class will follow the specifications of `discord.User` instances. For more
     information, see the `MockGuild` docstring.
     """
-    spec_set = user_instance
+    spec_set = discord.User
+    static_defaults = {'name': 'user', 'bot': False}
 
     def __init__(self, **kwargs) -> None:
-        default_kwargs = {'name': 'user', 'id': next(self.discord_id), 'bot': False}
-        super().__init__(**ChainMap(kwargs, default_kwargs))
+        default_kwargs = self.static_defaults | {'id': next(self.discord_id)}
+        super().__init__(**(default_kwargs | kwargs))
 
         if 'mention' not in kwargs:
             self.mention = f"@{self.name}"
@@ -263,7 +277,7 @@ class MockUser(CustomMockMixin, mock.Mock, ColourMixin, HashableMixin):
 
 def _get_mock_loop() -> mock.Mock:
     """Return a mocked asyncio.AbstractEventLoop."""
-    loop = mock.create_autospec(spec=AbstractEventLoop, spec_set=True)
+    loop = mock.Mock(spec_set=AbstractEventLoop)
 
     # Since calling `create_task` on our MockBot does not actually schedule the coroutine object
     # as a task in the asyncio loop, this `side_effect` calls `close()` on the coroutine object
@@ -277,42 +291,32 @@ def _get_mock_loop() -> mock.Mock:
     return loop
 
 
-class MockBot(CustomMockMixin, mock.MagicMock):
+class MockBot(CustomMockMixin, mock.Mock):
     """
-    A MagicMock subclass to mock Bot objects.
+    A Mock subclass to mock Bot objects.
 
     Instances of this class will follow the specifications of `discord.ext.commands.Bot` instances.
     For more information, see the `MockGuild` docstring.
     """
-    spec_set = Bot(mock=True)
     additional_spec_asyncs = ("wait_for",)
+    # Public attributes which `discord.Client` and `discord.ext.commands.Bot` only set in `__init__`.
+    additional_spec_attributes = (
+        "loop", "http", "ws", "shard_id", "shard_count", "owner_id", "owner_ids", "command_prefix", "description",
+        "debug_guilds", "http_session",
+    )
+
+    @property
+    def spec_set(self) -> type[Bot]:
+        """The Bot class used as spec, which is imported on first use as importing it also creates the bot."""
+        from src.bot import Bot
+
+        return Bot
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
         self.loop = _get_mock_loop()
-        self.http_session = mock.create_autospec(spec=ClientSession, spec_set=True)
-
-
-# Create a TextChannel instance to get a realistic MagicMock of `discord.TextChannel`
-channel_data = {
-    'id': 1,
-    'type': 'TextChannel',
-    'name': 'channel',
-    'parent_id': 1234567890,
-    'topic': 'topic',
-    'position': 1,
-    'nsfw': False,
-    'last_message_id': 1,
-}
-state = mock.MagicMock()
-guild = mock.MagicMock()
-# noinspection PyTypeChecker
-text_channel_instance = discord.TextChannel(state=state, guild=guild, data=channel_data)
-
-channel_data["type"] = "VoiceChannel"
-# noinspection PyTypeChecker
-voice_channel_instance = discord.VoiceChannel(state=state, guild=guild, data=channel_data)
+        self.http_session = mock.MagicMock(spec_set=ClientSession)
 
 
 class MockTextChannel(CustomMockMixin, mock.Mock, HashableMixin):
@@ -322,12 +326,15 @@ class MockTextChannel(CustomMockMixin, mock.Mock, HashableMixin):
     Instances of this class will follow the specifications of `discord.TextChannel` instances. For
     more information, see the `MockGuild` docstring.
     """
-    spec_set = text_channel_instance
+    spec_set = discord.TextChannel
     additional_spec_asyncs = ("send", "edit")
+    static_defaults = {'name': 'channel'}
 
     def __init__(self, **kwargs) -> None:
-        default_kwargs = {'id': next(self.discord_id), 'name': 'channel', 'guild': MockGuild()}
-        super().__init__(**ChainMap(kwargs, default_kwargs))
+        default_kwargs = self.static_defaults | {'id': next(self.discord_id)}
+        if 'guild' not in kwargs:
+            default_kwargs['guild'] = MockGuild()
+        super().__init__(**(default_kwargs | kwargs))
 
         if 'mention' not in kwargs:
             self.mention = f"#{self.name}"
@@ -340,24 +347,19 @@ class MockVoiceChannel(CustomMockMixin, mock.Mock, HashableMixin):
     Instances of this class will follow the specifications of `discord.VoiceChannel` instances. For
     more information, see the `MockGuild` docstring.
     """
-    spec_set = voice_channel_instance
+    spec_set = discord.VoiceChannel
+    static_defaults = {'name': 'channel'}
 
     def __init__(self, **kwargs) -> None:
-        default_kwargs = {'id': next(self.discord_id), 'name': 'channel', 'guild': MockGuild()}
-        super().__init__(**ChainMap(kwargs, default_kwargs))
+        default_kwargs = self.static_defaults | {'id': next(self.discord_id)}
+        if 'guild' not in kwargs:
+            default_kwargs['guild'] = MockGuild()
+        super().__init__(**(default_kwargs | kwargs))
 
         if 'mention' not in kwargs:
             self.mention = f"#{self.name}"
 
 
-# Create data for the DMChannel instance
-state = mock.MagicMock()
-me = mock.MagicMock()
-dm_channel_data = {"id": 1, "recipients": [mock.MagicMock()]}
-# noinspection PyTypeChecker
-dm_channel_instance = discord.DMChannel(me=me, state=state, data=dm_channel_data)
-
-
 class MockDMChannel(CustomMockMixin, mock.Mock, HashableMixin):
     """
     A MagicMock subclass to mock TextChannel objects.
@@ -365,55 +367,21 @@ class MockDMChannel(CustomMockMixin, mock.Mock, HashableMixin):
     Instances of this class will follow the specifications of `discord.TextChannel` instances. For
     more information, see the `MockGuild` docstring.
     """
-    spec_set = dm_channel_instance
+    spec_set = discord.DMChannel
 
     def __init__(self, **kwargs) -> None:
-        default_kwargs = {'id': next(self.discord_id), 'recipient': MockUser(), "me": MockUser()}
-        super().__init__(**ChainMap(kwargs, default_kwargs))
-
-
-# Create CategoryChannel instance to get a realistic MagicMock of `discord.CategoryChannel`
-category_channel_data = {
-    'id': 1,
-    'type': discord.ChannelType.category,
-    'name': 'category',
-    'position': 1,
-}
-
-state = mock.MagicMock()
-guild = mock.MagicMock()
-# noinspection PyTypeChecker
-category_channel_instance = discord.CategoryChannel(
-    state=state, guild=guild, data=category_channel_data
-)
+        default_kwargs = {'id': next(self.discord_id)}
+        if 'recipient' not in kwargs:
+            default_kwargs['recipient'] = MockUser()
+        if 'me' not in kwargs:
+            default_kwargs['me'] = MockUser()
+        super().__init__(**(default_kwargs | kwargs))
 
 
 class MockCategoryChannel(CustomMockMixin, mock.Mock, HashableMixin):
     def __init__(self, **kwargs) -> None:
         default_kwargs = {'id': next(self.discord_id)}
-        super().__init__(**ChainMap(default_kwargs, kwargs))
-
-
-# Create a Message instance to get a realistic MagicMock of `discord.Message`
-message_data = {
-    'id': 1,
-    'webhook_id': 431341013479718912,
-    'attachments': [],
-    'embeds': [],
-    'application': 'Python Discord',
-    'activity': 'mocking',
-    'channel': mock.MagicMock(),
-    'edited_timestamp': '2019-10-14T15:33:48+00:00',
-    'type': 'message',
-    'pinned': False,
-    'mention_everyone': False,
-    'tts': None,
-    'content': 'content',
-    'nonce': None,
-}
-state = mock.MagicMock()
-channel = mock.MagicMock()
-message_instance = discord.Message(state=state, channel=channel, data=message_data)
+        super().__init__(**(default_kwargs | kwargs))
 
 
 # Create a Context instance to get a realistic MagicMock of `discord.ext.commands.Context`
@@ -430,142 +398,135 @@ class Context(ApplicationContext):
         return self.interaction.response.send_message
 
 
-context_instance = Context(bot=MockBot(), interaction=mock.MagicMock())
-context_instance.invoked_from_error_handler = None
+@functools.cache
+def _get_context_instance() -> Context:
+    """Create the Context instance used as spec, only once a `MockContext` is actually needed."""
+    context_instance = Context(bot=MockBot(), interaction=mock.MagicMock())
+    context_instance.invoked_from_error_handler = None
+    return context_instance
 
 
-class MockContext(CustomMockMixin, mock.MagicMock):
+class MockContext(CustomMockMixin, mock.Mock):
     """
-    A MagicMock subclass to mock Context objects.
+    A Mock subclass to mock Context objects.
 
     Instances of this class will follow the specifications of `discord.ext.commands.Context`
     instances. For more information, see the `MockGuild` docstring.
     """
-    spec_set = context_instance
-
     additional_spec_asyncs = ("respond",)
 
+    @property
+    def spec_set(self) -> Context:
+        """The Context instance used as spec, which is created on first use."""
+        return _get_context_instance()
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.me = kwargs.get('me', MockMember())
-        self.bot = kwargs.get('src', MockBot())
-        self.guild = kwargs.get('guild', MockGuild())
-        self.author = kwargs.get('author', MockMember())
-        self.channel = kwargs.get('channel', MockTextChannel())
-        self.message = kwargs.get('message', MockMessage())
-        self.respond = mock.AsyncMock()
-
-
-dummy_attachment = {
-    "id": 123456789012345678,  # Snowflake, typically a large integer
-    "filename": "example_image.png",
-    "size": 1024,  # Size in bytes
-    "url": "http://example.com/example_image.png",
-    "proxy_url": "http://example.com/proxy_example_image.png",
-    "height": 600,  # Optional, int or None
-    "width": 800,  # Optional, int or None
-    "content_type": "image/png",  # Optional, string
-    "spoiler": False,  # Optional, boolean
-    "duration_secs": None,  # Optional, float or None
-    "waveform": None,  # Optional, string or None
-    "flags": 0  # Optional, int
-}
-attachment_instance = discord.Attachment(data=dummy_attachment, state=mock.MagicMock())
-
-
-class MockAttachment(CustomMockMixin, mock.MagicMock):
-    """
-    A MagicMock subclass to mock Attachment objects.
+        if 'me' not in kwargs:
+            self.me = MockMember()
+        if 'bot' not in kwargs:
+            self.bot = MockBot()
+        if 'guild' not in kwargs:
+            self.guild = MockGuild()
+        if 'author' not in kwargs:
+            self.author = MockMember()
+        if 'channel' not in kwargs:
+            self.channel = MockTextChannel()
+        if 'message' not in kwargs:
+            self.message = MockMessage()
+        if 'respond' not in kwargs:
+            self.respond = mock.AsyncMock()
+
+
+class MockAttachment(CustomMockMixin, mock.Mock):
+    """
+    A Mock subclass to mock Attachment objects.
 
     Instances of this class will follow the specifications of `discord.Attachment` instances. For
     more information, see the `MockGuild` docstring.
     """
-    spec_set = attachment_instance
+    spec_set = discord.Attachment
 
 
-class MockMessage(CustomMockMixin, mock.MagicMock):
+class MockMessage(CustomMockMixin, mock.Mock):
     """
-    A MagicMock subclass to mock Message objects.
+    A Mock subclass to mock Message objects.
 
     Instances of this class will follow the specifications of `discord.Message` instances. For more
     information, see the `MockGuild` docstring.
     """
-    spec_set = message_instance
+    spec_set = discord.Message
 
     def __init__(self, **kwargs) -> None:
         default_kwargs = {'attachments': []}
-        super().__init__(**ChainMap(kwargs, default_kwargs))
-        self.author = kwargs.get('author', MockMember())
-        self.channel = kwargs.get('channel', MockTextChannel())
-
+        super().__init__(**(default_kwargs | kwargs))
+        if 'author' not in kwargs:
+            self.author = MockMember()
+        if 'channel' not in kwargs:
+            self.channel = MockTextChannel()
 
-emoji_data = {'require_colons': True, 'managed': True, 'id': 1, 'name': 'hyperlemon'}
-# noinspection PyTypeChecker
-emoji_instance = discord.Emoji(guild=MockGuild(), state=mock.MagicMock(), data=emoji_data)
 
-
-class MockEmoji(CustomMockMixin, mock.MagicMock):
+class MockEmoji(CustomMockMixin, mock.Mock):
     """
-    A MagicMock subclass to mock Emoji objects.
+    A Mock subclass to mock Emoji objects.
 
     Instances of this class will follow the specifications of `discord.Emoji` instances. For more
     information, see the `MockGuild` docstring.
     """
-    spec_set = emoji_instance
+    spec_set = discord.Emoji
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.guild = kwargs.get('guild', MockGuild())
-
+        if 'guild' not in kwargs:
+            self.guild = MockGuild()
 
-partial_emoji_instance = discord.PartialEmoji(animated=False, name='guido')
 
-
-class MockPartialEmoji(CustomMockMixin, mock.MagicMock):
+class MockPartialEmoji(CustomMockMixin, mock.Mock):
     """
-    A MagicMock subclass to mock PartialEmoji objects.
+    A Mock subclass to mock PartialEmoji objects.
 
     Instances of this class will follow the specifications of `discord.PartialEmoji` instances. For
     more information, see the `MockGuild` docstring.
     """
-    spec_set = partial_emoji_instance
+    spec_set = discord.PartialEmoji
 
 
-# noinspection PyTypeChecker
-reaction_instance = discord.Reaction(message=MockMessage(), data={'me': True}, emoji=MockEmoji())
+async def _iterate_async(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Asynchronously yield the given items."""
+    for item in items:
+        yield item
 
 
-class MockReaction(CustomMockMixin, mock.MagicMock):
+class MockReaction(CustomMockMixin, mock.Mock):
     """
-    A MagicMock subclass to mock Reaction objects.
+    A Mock subclass to mock Reaction objects.
 
     Instances of this class will follow the specifications of `discord.Reaction` instances. For
     more information, see the `MockGuild` docstring.
     """
-    spec_set = reaction_instance
+    spec_set = discord.Reaction
 
     def __init__(self, **kwargs) -> None:
         _users = kwargs.pop("users", [])
         super().__init__(**kwargs)
-        self.emoji = kwargs.get('emoji', MockEmoji())
-        self.message = kwargs.get('message', MockMessage())
-
-        user_iterator = mock.AsyncMock()
-        user_iterator.__aiter__.return_value = _users
-        self.users.return_value = user_iterator
-
-        self.__str__.return_value = str(self.emoji)
+        if 'emoji' not in kwargs:
+            self.emoji = MockEmoji()
+        if 'message' not in kwargs:
+            self.message = MockMessage()
 
+        # Every call of `users` starts a new iteration over the users, like `discord.Reaction.users` does.
+        self.users.side_effect = lambda *args, **kwargs: _iterate_async(_users)
 
-webhook_instance = discord.Webhook(data=mock.MagicMock(), session=mock.MagicMock())
+        # `Mock` does not configure magic methods, so `__str__` is set explicitly.
+        self.__str__ = mock.Mock(return_value=str(self.emoji))
 
 
-class MockAsyncWebhook(CustomMockMixin, mock.MagicMock):
+class MockAsyncWebhook(CustomMockMixin, mock.Mock):
     """
-    A MagicMock subclass to mock Webhook objects using an AsyncWebhookAdapter.
+    A Mock subclass to mock Webhook objects using an AsyncWebhookAdapter.
 
     Instances of this class will follow the specifications of `discord.Webhook` instances. For
     more information, see the `MockGuild` docstring.
     """
-    spec_set = webhook_instance
+    spec_set = discord.Webhook
     additional_spec_asyncs = ("send", "edit", "delete", "execute")
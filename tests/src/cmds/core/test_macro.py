@@ -1,17 +1,20 @@
-from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, NonCallableMock, patch
 
-import arrow
 import pytest
-from discord import ApplicationContext, Embed, Interaction, WebhookMessage
-from sqlalchemy import select
+from discord import Embed
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from src.bot import Bot
 from src.cmds.core.macro import MacroCog
 from src.core import settings
 from src.database.models import Macro
 
+# The send command only reads the ids of the roles of the user.
+Role = namedtuple("Role", "id")
+ADMIN_ROLE = Role(settings.role_groups["ALL_ADMINS"][0])
+MEMBER_ROLE = Role(0)
+
 
 class MockScalarsResult:
     def __init__(self, return_value):
@@ -23,138 +26,138 @@ class MockScalarsResult:
     def all(self):
         return self.return_value
 
-@pytest.fixture
-def bot():
-    return MagicMock(spec=Bot)
-
 @pytest.fixture
 def cog(bot):
     return MacroCog(bot)
 
 @pytest.fixture
-def ctx():
-    mock_ctx = AsyncMock(spec=ApplicationContext)
-    mock_ctx.user = MagicMock()
-    mock_ctx.user.id = 12345
-    mock_ctx.respond = AsyncMock()
-    return mock_ctx
+def ctx(ctx):
+    # The `MockContext` of the conftest reuses the spec introspection of earlier mocks and mocks `respond`.
+    ctx.user = NonCallableMock()
+    ctx.user.id = 12345
+    return ctx
 
-@pytest.fixture
-def mock_session():
-    session = AsyncMock(spec=AsyncSession)
+class FakeSession:
+    """A minimal stand-in for `AsyncSession` which records what the macro commands do with it."""
+
+    def __init__(self):
+        self.added = []
+        self.deleted = []
+        self.commits = 0
+        self.commit_error = None
+        self.get_result = None
+        self.scalars_result = []
+
+    def add(self, instance):
+        self.added.append(instance)
 
-    # Configure the session methods
-    session.add = AsyncMock()
-    session.commit = AsyncMock()
-    session.delete = AsyncMock()
-    session.close = AsyncMock()
+    async def delete(self, instance):
+        self.deleted.append(instance)
 
-    async def mock_scalars(stmt):
-        return MockScalarsResult([])
+    async def commit(self):
+        if self.commit_error is not None:
+            raise self.commit_error
+        self.commits += 1
 
-    session.scalars = AsyncMock(side_effect=mock_scalars)
+    async def get(self, entity, ident):
+        return self.get_result
 
-    return session
+    async def scalars(self, stmt):
+        return MockScalarsResult(self.scalars_result)
+
+@pytest.fixture
+def mock_session():
+    return FakeSession()
 
 @pytest.fixture(autouse=True)
 def mock_session_maker(mock_session):
-    with patch('src.cmds.core.macro.AsyncSessionLocal') as mock:
-        cm = AsyncMock()
-        cm.__aenter__.return_value = mock_session
-        cm.__aexit__.return_value = None
-        mock.return_value = cm
-        yield mock
-
-@pytest.mark.asyncio
+    @asynccontextmanager
+    async def session_maker():
+        yield mock_session
+
+    with patch('src.cmds.core.macro.AsyncSessionLocal', new=session_maker):
+        yield session_maker
+
 async def test_add_macro_success(cog, ctx, mock_session):
     # Setup
     name = "test_macro"
     text = "This is a test macro"
-    # Configure mock to return None for the duplicate check
-    mock_session.scalars.return_value.first.return_value = None
-
     # Execute
     await cog.add.callback(cog, ctx, name=name, text=text)
 
     # Assert
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_called_once()
+    assert len(mock_session.added) == 1
+    assert mock_session.commits == 1
     ctx.respond.assert_called_once()
     assert "added" in ctx.respond.call_args[0][0]
 
-@pytest.mark.asyncio
 async def test_add_macro_duplicate_name(cog, ctx, mock_session):
     name = "existing_macro"
     text = "This is a test macro"
-    mock_session.commit = AsyncMock(side_effect=IntegrityError("", "", ""))
+    mock_session.commit_error = IntegrityError("", "", "")
 
     await cog.add.callback(cog, ctx, name=name, text=text)
 
-    mock_session.add.assert_called_once()
+    assert len(mock_session.added) == 1
     ctx.respond.assert_called_once_with(f"Macro with the name '{name}' already exists.", ephemeral=True)
 
 
-@pytest.mark.asyncio
 async def test_remove_macro_success(cog, ctx, mock_session):
     # Setup
     macro_id = 1
     mock_macro = Macro(id=macro_id, name="test")
-    mock_session.get = AsyncMock(return_value=mock_macro)
+    mock_session.get_result = mock_macro
 
     # Execute
     await cog.remove.callback(cog, ctx, macro_id=macro_id)
 
     # Assert
-    mock_session.delete.assert_called_once_with(mock_macro)
-    mock_session.commit.assert_called_once()
+    assert mock_session.deleted == [mock_macro]
+    assert mock_session.commits == 1
     ctx.respond.assert_called_once()
     assert f"#{macro_id}" in ctx.respond.call_args[0][0]
 
-@pytest.mark.asyncio
 async def test_remove_macro_not_found(cog, ctx, mock_session):
     # Setup
     macro_id = 999
-    mock_session.get = AsyncMock(return_value=None)
+    mock_session.get_result = None
 
     # Execute
     await cog.remove.callback(cog, ctx, macro_id=macro_id)
 
     # Assert
-    assert not mock_session.delete.called
-    assert not mock_session.commit.called
+    assert not mock_session.deleted
+    assert mock_session.commits == 0
     ctx.respond.assert_called_once_with(f"Macro #{macro_id} has not been found.", ephemeral=True)
 
-@pytest.mark.asyncio
 async def test_edit_macro_success(cog, ctx, mock_session):
     # Setup
     macro_id = 1
     new_text = "Updated macro text"
     mock_macro = Macro(id=macro_id, name="test", text="old text")
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars_result = mock_macro
 
     # Execute
     await cog.edit.callback(cog, ctx, macro_id=macro_id, text=new_text)
 
     # Assert
     assert mock_macro.text == new_text
-    mock_session.commit.assert_called_once()
+    assert mock_session.commits == 1
     ctx.respond.assert_called_once()
     assert f"#{macro_id}" in ctx.respond.call_args[0][0]
 
-@pytest.mark.asyncio
 async def test_edit_macro_not_found(cog, ctx, mock_session):
     # Setup
     macro_id = 999
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(None))
+    mock_session.scalars_result = None
 
     # Execute
     await cog.edit.callback(cog, ctx, macro_id=macro_id, text="new text")
 
     # Assert
-    assert not mock_session.commit.called
+    assert mock_session.commits == 0
     ctx.respond.assert_called_once_with(f"Macro #{macro_id} has not been found.", ephemeral=True)
 
-@pytest.mark.asyncio
 async def test_list_macros_success(cog, ctx, mock_session):
     # Setup
     macros = [
@@ -162,9 +165,7 @@ async def test_list_macros_success(cog, ctx, mock_session):
         Macro(id=2, name="macro2", text="text2")
     ]
 
-    # Mock the scalars call to directly return the macros
-    mock_session.scalars = AsyncMock()
-    mock_session.scalars.return_value = AsyncMock(all=lambda: macros)
+    mock_session.scalars_result = macros
 
     # Execute
     await cog.list.callback(cog, ctx)
@@ -180,10 +181,9 @@ async def test_list_macros_success(cog, ctx, mock_session):
         assert macro.name in field.name
         assert macro.text == field.value
 
-@pytest.mark.asyncio
 async def test_list_macros_empty(cog, ctx, mock_session):
     # Setup
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult([]))
+    mock_session.scalars_result = []
 
     # Execute
     await cog.list.callback(cog, ctx)
@@ -191,13 +191,12 @@ async def test_list_macros_empty(cog, ctx, mock_session):
     # Assert
     ctx.respond.assert_called_once_with("No macros have been added yet.")
 
-@pytest.mark.asyncio
 async def test_send_macro_success(cog, ctx, mock_session):
     # Setup
     name = "test_macro"
     text = "Macro text"
     mock_macro = Macro(name=name, text=text)
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars_result = mock_macro
 
     # Execute
     await cog.send.callback(cog, ctx, name=name)
@@ -205,11 +204,10 @@ async def test_send_macro_success(cog, ctx, mock_session):
     # Assert
     ctx.respond.assert_called_once_with(text)
 
-@pytest.mark.asyncio
 async def test_send_macro_not_found(cog, ctx, mock_session):
     # Setup
     name = "nonexistent"
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(None))
+    mock_session.scalars_result = None
 
     # Execute
     await cog.send.callback(cog, ctx, name=name)
@@ -218,7 +216,6 @@ async def test_send_macro_not_found(cog, ctx, mock_session):
     ctx.respond.assert_called_once()
     assert "has not been found" in ctx.respond.call_args[0][0]
 
-@pytest.mark.asyncio
 async def test_send_macro_to_channel_success(cog, ctx, mock_session):
     # Setup
     name = "test_macro"
@@ -226,10 +223,10 @@ async def test_send_macro_to_channel_success(cog, ctx, mock_session):
     mock_macro = Macro(name=name, text=text)
     mock_channel = AsyncMock()
     mock_channel.mention = "#test-channel"
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars_result = mock_macro
 
     # Mock admin role
-    ctx.user.roles = [MagicMock(id=settings.role_groups["ALL_ADMINS"][0])]
+    ctx.user.roles = [ADMIN_ROLE]
 
     # Execute
     await cog.send.callback(cog, ctx, name=name, channel=mock_channel)
@@ -238,17 +235,16 @@ async def test_send_macro_to_channel_success(cog, ctx, mock_session):
     mock_channel.send.assert_called_once_with(text)
     ctx.respond.assert_called_once_with(f"Macro {name} has been sent to #test-channel.", ephemeral=True)
 
-@pytest.mark.asyncio
 async def test_send_macro_to_channel_no_permission(cog, ctx, mock_session):
     # Setup
     name = "test_macro"
     text = "Macro text"
     mock_macro = Macro(name=name, text=text)
     mock_channel = AsyncMock()
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars_result = mock_macro
 
     # Mock regular user role
-    ctx.user.roles = [MagicMock(id=0)]
+    ctx.user.roles = [MEMBER_ROLE]
 
     # Execute
     await cog.send.callback(cog, ctx, name=name, channel=mock_channel)
@@ -257,7 +253,6 @@ async def test_send_macro_to_channel_no_permission(cog, ctx, mock_session):
     mock_channel.send.assert_not_called()
     ctx.respond.assert_called_once_with("You don't have permission to send macros in other channels.", ephemeral=True)
 
-@pytest.mark.asyncio
 async def test_send_macro_channel_error(cog, ctx, mock_session):
     # Setup
     name = "test_macro"
@@ -266,10 +261,10 @@ async def test_send_macro_channel_error(cog, ctx, mock_session):
     mock_channel = AsyncMock()
     mock_channel.send.side_effect = Exception("Channel error")
     mock_channel.mention = "#test-channel"
-    mock_session.scalars = AsyncMock(return_value=MockScalarsResult(mock_macro))
+    mock_session.scalars_result = mock_macro
 
     # Mock admin role
-    ctx.user.roles = [MagicMock(id=settings.role_groups["ALL_ADMINS"][0])]
+    ctx.user.roles = [ADMIN_ROLE]
 
     # Execute
     with pytest.raises(Exception, match="Channel error"):
@@ -1,56 +1,54 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from discord import ApplicationContext
 
-from src.bot import Bot
-from src.cmds.core import other
 from src.cmds.core.other import OtherCog, SpoilerModal
 from src.core import settings
 from src.helpers import webhook
 
+_JIRA_WEBHOOK = settings.JIRA_WEBHOOK
+
 
 class TestWebhookHelper:
     """Test the webhook helper functions."""
 
-    @pytest.mark.asyncio
-    async def test_webhook_call_success(self):
+    async def test_webhook_call_success(self, monkeypatch):
         """Test successful webhook call."""
         test_url = "http://test.webhook.url"
         test_data = {"key": "value"}
 
         # Mock the aiohttp ClientSession
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_post.return_value.__aenter__.return_value = mock_response
+        mock_post = MagicMock()
+        monkeypatch.setattr('aiohttp.ClientSession.post', mock_post)
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_post.return_value.__aenter__.return_value = mock_response
 
-            await webhook.webhook_call(test_url, test_data)
+        await webhook.webhook_call(test_url, test_data)
 
-            # Verify the post was called with correct parameters
-            mock_post.assert_called_once_with(test_url, json=test_data)
+        # Verify the post was called with correct parameters
+        mock_post.assert_called_once_with(test_url, json=test_data)
 
-    @pytest.mark.asyncio
-    async def test_webhook_call_failure(self):
+    async def test_webhook_call_failure(self, monkeypatch):
         """Test failed webhook call."""
         test_url = "http://test.webhook.url"
         test_data = {"key": "value"}
 
         # Mock the aiohttp ClientSession
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            mock_response = AsyncMock()
-            mock_response.status = 500
-            mock_response.text = AsyncMock(return_value="Internal Server Error")
-            mock_post.return_value.__aenter__.return_value = mock_response
+        mock_post = MagicMock()
+        monkeypatch.setattr('aiohttp.ClientSession.post', mock_post)
+        mock_response = AsyncMock()
+        mock_response.status = 500
+        mock_response.text = AsyncMock(return_value="Internal Server Error")
+        mock_post.return_value.__aenter__.return_value = mock_response
 
-            # Test should complete without raising an exception
-            await webhook.webhook_call(test_url, test_data)
+        # Test should complete without raising an exception
+        await webhook.webhook_call(test_url, test_data)
 
 
 class TestOther:
     """Test the `ChannelManage` cog."""
 
-    @pytest.mark.asyncio
     async def test_no_hints(self, bot, ctx):
         """Test the response of the `no_hints` command."""
         cog = OtherCog(bot)
@@ -67,30 +65,16 @@ class TestOther:
 
         assert content.startswith("No hints are allowed")
 
-    @pytest.mark.asyncio
-    async def test_support_labs(self, bot, ctx):
-        """Test the response of the `support` command."""
-        cog = other.OtherCog(bot)
-        ctx.bot = bot
-        platform = "labs"
-
-        # Invoke the command.
-        await cog.support.callback(cog, ctx, platform)
-
-        args, kwargs = ctx.respond.call_args
-        content = args[0]
-
-        # Command should respond with a string.
-        assert isinstance(content, str)
-
-        assert content == "https://help.hackthebox.com/en/articles/5986762-contacting-htb-support"
-
-    @pytest.mark.asyncio
-    async def test_support_academy(self, bot, ctx):
-        """Test the response of the `support` command."""
-        cog = other.OtherCog(bot)
+    @pytest.mark.parametrize(
+        "platform, expected_url", [
+            ("labs", "https://help.hackthebox.com/en/articles/5986762-contacting-htb-support"),
+            ("academy", "https://help.hackthebox.com/en/articles/5987511-contacting-academy-support"),
+        ]
+    )
+    async def test_support(self, bot, ctx, platform, expected_url):
+        """Test the response of the `support` command, which links to the support of each platform."""
+        cog = OtherCog(bot)
         ctx.bot = bot
-        platform = "academy"
 
         # Invoke the command.
         await cog.support.callback(cog, ctx, platform)
@@ -101,27 +85,9 @@ class TestOther:
         # Command should respond with a string.
         assert isinstance(content, str)
 
-        assert content == "https://help.hackthebox.com/en/articles/5987511-contacting-academy-support"
-
-    @pytest.mark.asyncio
-    async def test_support_urls_different(self, bot, ctx):
-        """Test that the URLs for 'labs' and 'academy' platforms are different."""
-        cog = other.OtherCog(bot)
-        ctx.bot = bot
-
-        # Test the 'labs' platform
-        await cog.support.callback(cog, ctx, "labs")
-        labs_url = ctx.respond.call_args[0][0]
-
-        # Test the 'academy' platform
-        await cog.support.callback(cog, ctx, "academy")
-        academy_url = ctx.respond.call_args[0][0]
-
-        # Assert that the URLs are different
-        assert labs_url != academy_url
+        assert content == expected_url
 
-    @pytest.mark.asyncio
-    async def test_spoiler_modal_callback_with_url(self):
+    async def test_spoiler_modal_callback_with_url(self, monkeypatch):
         """Test the spoiler modal callback with a valid URL."""
         modal = SpoilerModal(title="Report Spoiler")
         interaction = AsyncMock()
@@ -129,26 +95,26 @@ class TestOther:
         modal.children[0].value = "Test description"
         modal.children[1].value = "http://example.com/spoiler"
 
-        with patch('src.helpers.webhook.webhook_call', new_callable=AsyncMock) as mock_webhook:
-            await modal.callback(interaction)
-
-            interaction.response.send_message.assert_called_once_with(
-                "Thank you, the spoiler has been reported.", ephemeral=True
-            )
-
-            # Verify webhook was called with correct data
-            mock_webhook.assert_called_once_with(
-                settings.JIRA_WEBHOOK,
-                {
-                    "user": "TestUser",
-                    "url": "http://example.com/spoiler",
-                    "desc": "Test description",
-                    "type": "spoiler"
-                }
-            )
-
-    @pytest.mark.asyncio
-    async def test_cheater_command(self, bot, ctx):
+        mock_webhook = AsyncMock()
+        monkeypatch.setattr('src.helpers.webhook.webhook_call', mock_webhook)
+        await modal.callback(interaction)
+
+        interaction.response.send_message.assert_called_once_with(
+            "Thank you, the spoiler has been reported.", ephemeral=True
+        )
+
+        # Verify webhook was called with correct data
+        mock_webhook.assert_called_once_with(
+            _JIRA_WEBHOOK,
+            {
+                "user": "TestUser",
+                "url": "http://example.com/spoiler",
+                "desc": "Test description",
+                "type": "spoiler"
+            }
+        )
+
+    async def test_cheater_command(self, bot, ctx, monkeypatch):
         """Test the cheater command with valid inputs."""
         cog = OtherCog(bot)
         ctx.bot = bot
@@ -157,31 +123,23 @@ class TestOther:
         test_username = "SuspectedUser"
         test_description = "Suspicious activity description"
 
-        with patch('src.helpers.webhook.webhook_call', new_callable=AsyncMock) as mock_webhook:
-            await cog.cheater.callback(cog, ctx, test_username, test_description)
-
-            # Verify the webhook was called with correct data
-            mock_webhook.assert_called_once_with(
-                settings.JIRA_WEBHOOK,
-                {
-                    "user": "ReporterUser",
-                    "cheater": test_username,
-                    "description": test_description,
-                    "type": "cheater"
-                }
-            )
-
-            # Verify the response was sent
-            ctx.respond.assert_called_once_with(
-                "Thank you for your report.",
-                ephemeral=True
-            )
-
-
-
-    def test_setup(self, bot):
-        """Test the setup method of the cog."""
-        # Invoke the command
-        other.setup(bot)
-
-        bot.add_cog.assert_called_once()
+        mock_webhook = AsyncMock()
+        monkeypatch.setattr('src.helpers.webhook.webhook_call', mock_webhook)
+        await cog.cheater.callback(cog, ctx, test_username, test_description)
+
+        # Verify the webhook was called with correct data
+        mock_webhook.assert_called_once_with(
+            _JIRA_WEBHOOK,
+            {
+                "user": "ReporterUser",
+                "cheater": test_username,
+                "description": test_description,
+                "type": "cheater"
+            }
+        )
+
+        # Verify the response was sent
+        ctx.respond.assert_called_once_with(
+            "Thank you for your report.",
+            ephemeral=True
+        )
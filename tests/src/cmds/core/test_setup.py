@@ -0,0 +1,20 @@
+import importlib
+
+import pytest
+
+CORE_COGS = (
+    "ban", "channel", "ctf", "fun", "history", "identify", "macro", "mute", "note", "other", "ping", "user", "verify",
+)
+
+
+class TestCogSetup:
+    """Test the `setup` functions of the core cogs."""
+
+    @pytest.mark.parametrize("name", CORE_COGS)
+    def test_setup(self, setup_bot, name):
+        """Test the setup method of the cog."""
+        module = importlib.import_module(f"src.cmds.core.{name}")
+        # Invoke the command
+        module.setup(setup_bot)
+
+        setup_bot.add_cog.assert_called_once()
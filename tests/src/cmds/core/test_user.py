@@ -1,5 +1,6 @@
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -7,61 +8,53 @@ from src.cmds.core import user
 from tests import helpers
 
 
+@pytest.fixture
+def kick_setup(ctx, guild, bot, monkeypatch):
+    """Set up a moderator kicking a member who is still in the guild."""
+    ctx.user = helpers.MockMember(id=1, name="Test Moderator")
+    user_to_kick = helpers.MockMember(id=2, name="User to Kick", bot=False)
+    ctx.guild = guild
+    ctx.guild.kick = AsyncMock()
+    bot.get_member_or_user = AsyncMock(return_value=user_to_kick)
+    monkeypatch.setattr('src.cmds.core.user.member_is_staff', Mock(return_value=False))
+    return SimpleNamespace(cog=user.UserCog(bot), user_to_kick=user_to_kick)
+
+
 class TestUserCog:
     """Test the `User` cog."""
 
-    @pytest.mark.asyncio
-    async def test_kick_success(self, ctx, guild, bot, session):
-        ctx.user = helpers.MockMember(id=1, name="Test Moderator")
-        user_to_kick = helpers.MockMember(id=2, name="User to Kick", bot=False)
-        ctx.guild = guild
-        ctx.guild.kick = AsyncMock()
-        bot.get_member_or_user = AsyncMock(return_value=user_to_kick)
+    async def test_kick_success(self, ctx, kick_setup, session, monkeypatch):
+        user_to_kick = kick_setup.user_to_kick
 
         # Mock the DM channel
         user_to_kick.send = AsyncMock()
-        user_to_kick.name = "User to Kick"
-
-        with (
-            patch('src.cmds.core.user.add_infraction', new_callable=AsyncMock) as add_infraction_mock,
-            patch('src.cmds.core.user.add_evidence_note', new_callable=AsyncMock) as add_evidence_mock,
-            patch('src.cmds.core.user.member_is_staff', return_value=False)
-        ):
-            cog = user.UserCog(bot)
-            await cog.kick.callback(cog, ctx, user_to_kick, "Violation of rules")
-
-            reason = "Violation of rules"
-            add_evidence_mock.assert_called_once_with(user_to_kick.id, "kick", reason, None, ctx.user.id)
-            add_infraction_mock.assert_called_once_with(
-                ctx.guild, user_to_kick, 0, f"{ctx.user.name} was kicked on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} for {reason}", ctx.user
-            )
 
-            # Assertions
-            ctx.guild.kick.assert_called_once_with(user=user_to_kick, reason="Violation of rules")
-            ctx.respond.assert_called_once_with("User to Kick got the boot!")
+        add_infraction_mock = AsyncMock()
+        add_evidence_mock = AsyncMock()
+        monkeypatch.setattr('src.cmds.core.user.add_infraction', add_infraction_mock)
+        monkeypatch.setattr('src.cmds.core.user.add_evidence_note', add_evidence_mock)
 
-    @pytest.mark.asyncio
-    async def test_kick_fail_user_left(self, ctx, guild, bot, session):
-        ctx.user = helpers.MockMember(id=1, name="Test Moderator")
-        user_to_kick = helpers.MockMember(id=2, name="User to Kick", bot=False)
-        ctx.guild = guild
-        ctx.guild.kick = AsyncMock()
-        bot.get_member_or_user = AsyncMock(return_value=None)
+        cog = kick_setup.cog
+        await cog.kick.callback(cog, ctx, user_to_kick, "Violation of rules")
 
-        # Ensure the member_is_staff mock doesn't block execution
-        with patch('src.cmds.core.user.member_is_staff', return_value=False):
-            cog = user.UserCog(bot)
-            await cog.kick.callback(cog, ctx, user_to_kick, "Violation of rules")
+        reason = "Violation of rules"
+        add_evidence_mock.assert_called_once_with(user_to_kick.id, "kick", reason, None, ctx.user.id)
+        add_infraction_mock.assert_called_once_with(
+            ctx.guild, user_to_kick, 0, f"{ctx.user.name} was kicked on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} for {reason}", ctx.user
+        )
 
-            # Assertions
-            bot.get_member_or_user.assert_called_once_with(ctx.guild, user_to_kick.id)
-            ctx.guild.kick.assert_not_called()  # No kick should occur
-            ctx.respond.assert_called_once_with("User seems to have already left the server.")
+        # Assertions
+        ctx.guild.kick.assert_called_once_with(user=user_to_kick, reason="Violation of rules")
+        ctx.respond.assert_called_once_with("User to Kick got the boot!")
 
+    async def test_kick_fail_user_left(self, ctx, kick_setup, bot, session):
+        user_to_kick = kick_setup.user_to_kick
+        bot.get_member_or_user.return_value = None
 
-    def test_setup(self, bot):
-        """Test the setup method of the cog."""
-        # Invoke the command
-        user.setup(bot)
+        cog = kick_setup.cog
+        await cog.kick.callback(cog, ctx, user_to_kick, "Violation of rules")
 
-        bot.add_cog.assert_called_once()
+        # Assertions
+        bot.get_member_or_user.assert_called_once_with(ctx.guild, user_to_kick.id)
+        ctx.guild.kick.assert_not_called()  # No kick should occur
+        ctx.respond.assert_called_once_with("User seems to have already left the server.")
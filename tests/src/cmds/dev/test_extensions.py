@@ -4,9 +4,9 @@ from src.cmds.dev import extensions
 class TestExtensions:
     """Test the `Extensions` cog."""
 
-    def test_setup(self, bot):
+    def test_setup(self, setup_bot):
         """Test the setup method of the cog."""
         # Invoke the command
-        extensions.setup(bot)
+        extensions.setup(setup_bot)
 
-        bot.add_cog.assert_called_once()
+        setup_bot.add_cog.assert_called_once()
@@ -1,4 +1,3 @@
-import pytest
 from sqlalchemy import delete, insert, update
 
 from src.database.models import Ban
@@ -6,7 +5,6 @@ from src.database.models import Ban
 
 class TestBanModel:
 
-    @pytest.mark.asyncio
     async def test_select(self, session):
         async with session() as session:
             # Define return value for select
@@ -18,7 +16,6 @@ class TestBanModel:
             # Check if the method was called with the correct argument
             session.get.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_insert(self, session):
         async with session() as session:
             # Define return value for insert
@@ -33,7 +30,6 @@ class TestBanModel:
             session.add.assert_called_once_with(query)
             session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_insert_unban_time_bigint(self, session):
         async with session() as session:
             # Define return value for insert
@@ -48,7 +44,6 @@ class TestBanModel:
             session.add.assert_called_once_with(query)
             session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update(self, session):
         async with session() as session:
             # Define return value for update
@@ -67,7 +62,6 @@ class TestBanModel:
             session.execute.assert_called_once_with(query)
             session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delete(self, session):
         async with session() as session:
             # Define a Ban record to delete
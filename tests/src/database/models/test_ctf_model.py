@@ -1,6 +1,5 @@
 import random
 
-import pytest
 from sqlalchemy import delete, insert
 
 from src.database.models import Ctf
@@ -8,7 +7,6 @@ from src.database.models import Ctf
 
 class TestCtfModel:
 
-    @pytest.mark.asyncio
     async def test_select(self, session):
         async with session() as session:
             # Define return value for select
@@ -25,7 +23,6 @@ class TestCtfModel:
             # Check if the method was called with the correct argument
             session.get.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_insert(self, session):
         async with session() as session:
             # Define return value for insert
@@ -43,7 +40,6 @@ class TestCtfModel:
             session.add.assert_called_once_with(query)
             session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delete(self, session):
         async with session() as session:
             # Define a Ctf record to delete
@@ -1,11 +1,9 @@
-import pytest
 from sqlalchemy import delete, insert, update
 
 from src.database.models import Macro
 
 
 class TestMacroModel:
-    @pytest.mark.asyncio
     async def test_select(self, session):
         async with session() as session:
             # Define return value for select
@@ -17,7 +15,6 @@ class TestMacroModel:
             # Check if the method was called with the correct argument
             session.get.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_insert(self, session):
         async with session() as session:
             # Define return value for insert
@@ -32,7 +29,6 @@ class TestMacroModel:
             session.add.assert_called_once_with(query)
             session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update(self, session):
         async with session() as session:
             # Define return value for update
@@ -51,7 +47,6 @@ class TestMacroModel:
             session.execute.assert_called_once_with(query)
             session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delete(self, session):
         async with session() as session:
             # Define return value for delete
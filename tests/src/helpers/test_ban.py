@@ -1,5 +1,6 @@
+from types import SimpleNamespace
 from unittest import mock
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from discord import Forbidden, HTTPException
@@ -9,9 +10,30 @@ from src.helpers.responses import SimpleResponse
 from tests import helpers
 
 
+# Built once for the module and reset by `ban_mocks`, instead of being created by `mock.patch` for every test.
+_BAN_MOCKS = {
+    "_check_member": AsyncMock(),
+    "_dm_banned_member": AsyncMock(),
+    "_get_ban_or_create": AsyncMock(),
+    "validate_duration": Mock(),
+}
+
+
+@pytest.fixture
+def ban_mocks():
+    """Patch the helpers called by `ban_member`, so that by default the ban goes through."""
+    for helper in _BAN_MOCKS.values():
+        helper.reset_mock(return_value=True, side_effect=True)
+    _BAN_MOCKS["_check_member"].return_value = None
+    _BAN_MOCKS["_dm_banned_member"].return_value = True
+    _BAN_MOCKS["_get_ban_or_create"].return_value = (1, False)
+    _BAN_MOCKS["validate_duration"].return_value = (1684276900, "")
+    with patch.multiple("src.helpers.ban", **_BAN_MOCKS):
+        yield SimpleNamespace(**_BAN_MOCKS)
+
+
 class TestBanHelpers:
 
-    @pytest.mark.asyncio
     async def test__check_member_staff_member(self, bot, guild, member):
         author = helpers.MockMember(name="Author User")
         member_is_staff = mock.Mock(return_value=True)
@@ -21,7 +43,6 @@ class TestBanHelpers:
             assert response.message == "You cannot ban another staff member."
             assert response.delete_after is None
 
-    @pytest.mark.asyncio
     async def test__check_member_regular_member(self, bot, guild, member):
         author = helpers.MockMember(name="Author User")
         member_is_staff = mock.Mock(return_value=False)
@@ -29,7 +50,6 @@ class TestBanHelpers:
             response = await _check_member(bot, guild, member, author)
             assert response is None
 
-    @pytest.mark.asyncio
     async def test__check_member_user(self, bot, guild, user):
         author = helpers.MockMember(name="Author User")
         bot.get_member_or_user = AsyncMock()
@@ -38,7 +58,6 @@ class TestBanHelpers:
         assert await bot.get_member_or_user.called_once_with(guild, user.id)
         assert response is None
 
-    @pytest.mark.asyncio
     async def test__check_member_ban_bot(self, bot, guild, member):
         author = helpers.MockMember(name="Author User")
         member.bot = True
@@ -47,7 +66,6 @@ class TestBanHelpers:
         assert response.message == "You cannot ban a bot."
         assert response.delete_after is None
 
-    @pytest.mark.asyncio
     async def test__check_member_ban_self(self, bot, guild, member):
         author = member
         response = await _check_member(bot, guild, member, author)
@@ -55,7 +73,6 @@ class TestBanHelpers:
         assert response.message == "You cannot ban yourself."
         assert response.delete_after is None
 
-    @pytest.mark.asyncio
     async def test__dm_banned_member_success(self, guild, member):
         member.send = AsyncMock()
         end_date = "2023-05-19"
@@ -68,7 +85,6 @@ class TestBanHelpers:
         )
         assert result is True
 
-    @pytest.mark.asyncio
     async def test__dm_banned_member_forbidden_exception(self, guild, member):
         class MockResponse:
             def __init__(self, status, reason):
@@ -87,7 +103,6 @@ class TestBanHelpers:
             result = await _dm_banned_member("2023-05-19", guild, member, "Violation of community guidelines")
         assert result is False
 
-    @pytest.mark.asyncio
     async def test__dm_banned_member_http_exception(self, guild, member):
         class MockResponse:
             def __init__(self, status, reason):
@@ -109,114 +124,55 @@ class TestBanHelpers:
 
 class TestBanMember:
 
-    @pytest.mark.asyncio
-    async def test_ban_member_valid_duration(self, bot, guild, member, author):
+    async def test_ban_member_valid_duration(self, bot, guild, member, author, ban_mocks):
         duration = "1d"
         reason = "xf reason"
         evidence = "Some evidence"
         member.display_name = "Banned Member"
 
-        with (
-            mock.patch("src.helpers.ban._check_member", return_value=None),
-            mock.patch("src.helpers.ban._dm_banned_member", return_value=True),
-            mock.patch("src.helpers.ban._get_ban_or_create", return_value=(1, False)),
-            mock.patch("src.helpers.ban.validate_duration", return_value=(1684276900, "")),
-        ):
-            mock_channel = helpers.MockTextChannel()
-            mock_channel.send.return_value = MagicMock()
-            guild.get_channel.return_value = mock_channel
-
-            result = await ban_member(bot, guild, member, duration, reason, evidence)
-            assert isinstance(result, SimpleResponse)
-            assert result.message == f"{member.display_name} ({member.id}) has been banned until 2023-05-16 22:41:40 " \
-                                     f"(UTC)."
-
-    @pytest.mark.asyncio
-    async def test_ban_member_invalid_duration(self, bot, guild, member, author):
-        duration = "1d"
-        reason = "xf reason"
-        evidence = "Some evidence"
-        member.display_name = "Banned Member"
+        mock_channel = helpers.MockTextChannel()
+        mock_channel.send.return_value = MagicMock()
+        guild.get_channel.return_value = mock_channel
 
-        with (
-            mock.patch("src.helpers.ban._check_member", return_value=None),
-            mock.patch("src.helpers.ban.validate_duration", return_value=(0, "Invalid duration: could not parse.")),
-        ):
-            result = await ban_member(bot, guild, member, duration, reason, evidence)
-            assert isinstance(result, SimpleResponse)
-            assert result.message == "Invalid duration: could not parse."
+        result = await ban_member(bot, guild, member, duration, reason, evidence)
+        assert isinstance(result, SimpleResponse)
+        assert result.message == f"{member.display_name} ({member.id}) has been banned until 2023-05-16 22:41:40 " \
+                                 f"(UTC)."
 
-    @pytest.mark.asyncio
-    async def test_ban_member_permanently_success(self, bot, guild, member, author):
-        duration = "500w"
-        reason = "Why not?"
+    async def test_ban_member_invalid_duration(self, bot, guild, member, author, ban_mocks):
+        duration = "1d"
+        reason = "xf reason"
         evidence = "Some evidence"
         member.display_name = "Banned Member"
+        ban_mocks.validate_duration.return_value = (0, "Invalid duration: could not parse.")
 
-        # Patching the necessary classes and functions
-        with (
-            mock.patch("src.helpers.ban._check_member", return_value=None),
-            mock.patch("src.helpers.ban._dm_banned_member", return_value=True),
-            mock.patch("src.helpers.ban._get_ban_or_create", return_value=(1, False)),
-            mock.patch("src.helpers.ban.validate_duration", return_value=(1684276900, "")),
-        ):
-            response = await ban_member(bot, guild, member, duration, reason, evidence, author, False)
-            assert isinstance(response, SimpleResponse)
-            assert response.message == f"Member {member.display_name} has been banned permanently."
+        result = await ban_member(bot, guild, member, duration, reason, evidence)
+        assert isinstance(result, SimpleResponse)
+        assert result.message == "Invalid duration: could not parse."
 
-    @pytest.mark.asyncio
-    async def test_ban_member_no_reason_success(self, bot, guild, member, author):
+    @pytest.mark.parametrize("reason, has_author", [("Why not?", True), ("", True), ("", False)])
+    async def test_ban_member_permanently_success(self, bot, guild, member, author, ban_mocks, reason, has_author):
         duration = "500w"
-        reason = ""
         evidence = "Some evidence"
         member.display_name = "Banned Member"
 
-        # Patching the necessary classes and functions
-        with (
-            mock.patch("src.helpers.ban._check_member", return_value=None),
-            mock.patch("src.helpers.ban._dm_banned_member", return_value=True),
-            mock.patch("src.helpers.ban._get_ban_or_create", return_value=(1, False)),
-            mock.patch("src.helpers.ban.validate_duration", return_value=(1684276900, "")),
-        ):
-            response = await ban_member(bot, guild, member, duration, reason, evidence, author, False)
-            assert isinstance(response, SimpleResponse)
-            assert response.message == f"Member {member.display_name} has been banned permanently."
-
-    @pytest.mark.asyncio
-    async def test_ban_member_no_author_success(self, bot, guild, member):
-        duration = '500w'
-        reason = ""
-        evidence = "Some evidence"
-        member.display_name = "Banned Member"
-
-        with (
-            mock.patch("src.helpers.ban._check_member", return_value=None),
-            mock.patch("src.helpers.ban._dm_banned_member", return_value=True),
-            mock.patch("src.helpers.ban._get_ban_or_create", return_value=(1, False)),
-            mock.patch("src.helpers.ban.validate_duration", return_value=(1684276900, "")),
-        ):
-            response = await ban_member(bot, guild, member, duration, reason, evidence, None, False)
-            assert isinstance(response, SimpleResponse)
-            assert response.message == f"Member {member.display_name} has been banned permanently."
+        response = await ban_member(
+            bot, guild, member, duration, reason, evidence, author if has_author else None, False
+        )
+        assert isinstance(response, SimpleResponse)
+        assert response.message == f"Member {member.display_name} has been banned permanently."
 
-    @pytest.mark.asyncio
-    async def test_ban_already_exists(self, bot, guild, member, author):
+    async def test_ban_already_exists(self, bot, guild, member, author, ban_mocks):
         duration = '500w'
         reason = ""
         evidence = "Some evidence"
         member.display_name = "Banned Member"
+        ban_mocks._get_ban_or_create.return_value = (1, True)
 
-        with (
-            mock.patch("src.helpers.ban._check_member", return_value=None),
-            mock.patch("src.helpers.ban._dm_banned_member", return_value=True),
-            mock.patch("src.helpers.ban._get_ban_or_create", return_value=(1, True)),
-            mock.patch("src.helpers.ban.validate_duration", return_value=(1684276900, "")),
-        ):
-            response = await ban_member(bot, guild, member, duration, reason, evidence, author)
-            assert isinstance(response, SimpleResponse)
-            assert response.message == f"A ban with id: 1 already exists for member {member}"
+        response = await ban_member(bot, guild, member, duration, reason, evidence, author)
+        assert isinstance(response, SimpleResponse)
+        assert response.message == f"A ban with id: 1 already exists for member {member}"
 
-    @pytest.mark.asyncio
     async def test_ban_member_staff(self, ctx, bot, guild):
         ctx.user = helpers.MockMember(id=1, name="Test User")
         user = helpers.MockMember(id=2, name="Banned User")
@@ -228,7 +184,6 @@ class TestBanMember:
         assert isinstance(response, SimpleResponse)
         assert response.message == "You cannot ban another staff member."
 
-    @pytest.mark.asyncio
     async def test_ban_member_bot(self, ctx, bot, guild):
         ctx.user = helpers.MockMember(id=1, name="Test User")
         member = helpers.MockMember(id=2, name="Bot Member", bot=True)
@@ -240,7 +195,6 @@ class TestBanMember:
         assert isinstance(response, SimpleResponse)
         assert response.message == "You cannot ban a bot."
 
-    @pytest.mark.asyncio
     async def test_ban_self(self, ctx, bot, guild):
         ctx.user = helpers.MockMember(id=1, name="Test User")
         with patch('src.helpers.ban.member_is_staff', return_value=False):
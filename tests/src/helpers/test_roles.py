@@ -0,0 +1,117 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from discord import Forbidden
+
+from src.helpers import roles
+from tests import helpers
+
+
+def _role(role_id: int) -> helpers.MockRole:
+    return helpers.MockRole(id=role_id, **{"is_default.return_value": False})
+
+
+@pytest.fixture
+def member(member):
+    # The roles are read from the guild's member cache right before they are updated.
+    member.guild.get_member.return_value = member
+    return member
+
+
+class TestUpdateMemberRoles:
+
+    async def test_updates_are_applied_with_one_request(self, member):
+        member.roles = [_role(1), _role(2)]
+
+        with mock.patch("src.helpers.roles.ROLE_UPDATE_DELAY", 0):
+            await asyncio.gather(
+                roles.update_member_roles(member, add={3}),
+                roles.update_member_roles(member, remove={1}),
+                roles.update_member_roles(member, add={4}),
+            )
+
+        member.edit.assert_called_once()
+        assert {role.id for role in member.edit.call_args.kwargs["roles"]} == {2, 3, 4}
+
+    async def test_latest_update_wins(self, member):
+        member.roles = [_role(1)]
+
+        with mock.patch("src.helpers.roles.ROLE_UPDATE_DELAY", 0):
+            await asyncio.gather(
+                roles.update_member_roles(member, add={2}),
+                roles.update_member_roles(member, remove={2}),
+            )
+
+        member.edit.assert_not_called()
+
+    async def test_no_request_when_roles_are_up_to_date(self, member):
+        member.roles = [_role(1), _role(2)]
+
+        with mock.patch("src.helpers.roles.ROLE_UPDATE_DELAY", 0):
+            await roles.update_member_roles(member, add={2}, remove={3})
+
+        member.edit.assert_not_called()
+
+    async def test_roles_given_in_the_meantime_are_kept(self, member):
+        member.roles = [_role(1)]
+        current_member = helpers.MockMember(id=member.id)
+        current_member.roles = [_role(1), _role(5)]
+        member.guild.get_member.return_value = current_member
+
+        with mock.patch("src.helpers.roles.ROLE_UPDATE_DELAY", 0):
+            await roles.update_member_roles(member, add={2})
+
+        current_member.edit.assert_called_once()
+        assert {role.id for role in current_member.edit.call_args.kwargs["roles"]} == {1, 2, 5}
+
+    async def test_failed_update_is_raised_to_every_caller(self, member):
+        member.roles = [_role(1)]
+        member.edit.side_effect = Forbidden(mock.Mock(status=403, reason="Forbidden"), "Missing Permissions")
+
+        with mock.patch("src.helpers.roles.ROLE_UPDATE_DELAY", 0):
+            results = await asyncio.gather(
+                roles.update_member_roles(member, add={2}),
+                roles.update_member_roles(member, add={3}),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, Forbidden) for result in results)
+        member.edit.assert_called_once()
+
+    async def test_update_made_during_an_edit_is_based_on_its_result(self, member):
+        # The guild's member cache still has the roles from before the first edit when the second update is applied.
+        member.roles = [_role(100)]
+        edited_member = helpers.MockMember(id=member.id)
+        edit_started, finish_edit = asyncio.Event(), asyncio.Event()
+
+        async def slow_edit(*, roles, reason):
+            edit_started.set()
+            await finish_edit.wait()
+            edited_member.roles = [_role(role.id) for role in roles]
+            return edited_member
+
+        member.edit.side_effect = slow_edit
+
+        with mock.patch("src.helpers.roles.ROLE_UPDATE_DELAY", 0):
+            first = asyncio.create_task(roles.update_member_roles(member, add={1}))
+            await edit_started.wait()
+            second = asyncio.create_task(roles.update_member_roles(member, add={2}))
+            await asyncio.sleep(0.01)
+            finish_edit.set()
+            await asyncio.gather(first, second)
+
+        member.edit.assert_called_once()
+        edited_member.edit.assert_called_once()
+        assert {role.id for role in edited_member.edit.call_args.kwargs["roles"]} == {1, 2, 100}
+
+    async def test_reasons_of_merged_updates_are_joined(self, member):
+        member.roles = [_role(1)]
+
+        with mock.patch("src.helpers.roles.ROLE_UPDATE_DELAY", 0):
+            await asyncio.gather(
+                roles.update_member_roles(member, add={2}, reason="Account linked"),
+                roles.update_member_roles(member, add={3}, reason="Certificate awarded"),
+            )
+
+        assert member.edit.call_args.kwargs["reason"] == "Account linked; Certificate awarded"
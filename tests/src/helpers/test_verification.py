@@ -1,15 +1,15 @@
 import unittest
+from unittest import mock
 
 import aioresponses
-import pytest
 
 from src.core import settings
-from src.helpers.verification import get_user_details
+from src.helpers.verification import get_user_details, process_identification
+from tests import helpers
 
 
 class TestGetUserDetails(unittest.IsolatedAsyncioTestCase):
 
-    @pytest.mark.asyncio
     async def test_get_user_details_success(self):
         account_identifier = "some_identifier"
 
@@ -23,7 +23,6 @@ class TestGetUserDetails(unittest.IsolatedAsyncioTestCase):
             result = await get_user_details(account_identifier)
             self.assertEqual(result, {"some_key": "some_value"})
 
-    @pytest.mark.asyncio
     async def test_get_user_details_404(self):
         account_identifier = "some_identifier"
 
@@ -36,7 +35,6 @@ class TestGetUserDetails(unittest.IsolatedAsyncioTestCase):
             result = await get_user_details(account_identifier)
             self.assertIsNone(result)
 
-    @pytest.mark.asyncio
     async def test_get_user_details_other_status(self):
         account_identifier = "some_identifier"
 
@@ -48,3 +46,36 @@ class TestGetUserDetails(unittest.IsolatedAsyncioTestCase):
 
             result = await get_user_details(account_identifier)
             self.assertIsNone(result)
+
+
+def _role(role_id: int) -> helpers.MockRole:
+    return helpers.MockRole(id=role_id, **{"is_default.return_value": False})
+
+
+class TestProcessIdentification(unittest.IsolatedAsyncioTestCase):
+
+    async def test_roles_outside_the_rank_groups_are_kept(self):
+        htb_user_details = {
+            "user_id": 1, "user_name": "Hacker User", "rank": "Hacker", "vip": False, "dedivip": False,
+            "hof_position": "unranked", "machines": 0, "challenges": 0,
+        }
+        guild = helpers.MockGuild()
+        guild.get_role.side_effect = _role
+        member = helpers.MockMember(guild=guild, nick="Hacker User")
+        member.roles = [_role(settings.roles.NOOB)]
+        # The member got another role after it was fetched, which the cached member already has.
+        current_member = helpers.MockMember(id=member.id, guild=guild, nick="Hacker User")
+        current_member.roles = [_role(settings.roles.NOOB), _role(settings.roles.BOX_CREATOR)]
+        guild.get_member.return_value = current_member
+
+        with (
+            mock.patch("src.helpers.verification.get_season_rank", return_value=None),
+            mock.patch("src.helpers.verification._check_for_ban", return_value=None),
+            mock.patch("src.helpers.roles.ROLE_UPDATE_DELAY", 0),
+        ):
+            await process_identification(htb_user_details, member, helpers.MockBot())
+
+        current_member.edit.assert_called_once()
+        role_ids = {role.id for role in current_member.edit.call_args.kwargs["roles"]}
+        self.assertEqual(role_ids, {settings.roles.BOX_CREATOR, settings.roles.HACKER})
+        self.assertEqual(current_member.edit.call_args.kwargs["reason"], "Identification")
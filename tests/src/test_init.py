@@ -0,0 +1,15 @@
+from unittest import mock
+
+from yarl import URL
+
+from src import on_request_end
+
+
+async def test_on_request_end_leaves_out_the_query_string():
+    response = mock.Mock(method="GET", status=200, url=URL("https://example.com/api/user?secret=hunter2"))
+    response.version.major, response.version.minor = 1, 1
+
+    with mock.patch("src.aiohttp_client_logger") as logger:
+        await on_request_end(None, None, mock.Mock(response=response))
+
+    logger.debug.assert_called_once_with('"GET - HTTP/1.1" https://example.com/api/user <200>')
@@ -0,0 +1,90 @@
+from unittest import mock
+
+import pytest
+from discord import Forbidden, NotFound
+from fastapi import HTTPException
+
+from src.core import settings
+from src.webhooks.handlers import academy
+from src.webhooks.types import Platform, WebhookBody, WebhookEvent
+from tests import helpers
+
+CBBH = settings.academy_certificates.CERTIFIED_BUG_BOUNTY_HUNTER
+CPTS = settings.academy_certificates.CERTIFIED_PENETRATION_TESTING_SPECIALIST
+
+
+def _body(event: WebhookEvent, member: helpers.MockMember, **data) -> WebhookBody:
+    return WebhookBody(platform=Platform.ACADEMY, event=event, data={"discord_id": member.id, **data})
+
+
+@pytest.fixture
+def update_member_roles():
+    with mock.patch("src.webhooks.handlers.academy.update_member_roles") as update_member_roles:
+        yield update_member_roles
+
+
+@pytest.fixture
+def bot(bot, guild, member):
+    bot.get_guild.return_value = guild
+    guild.get_member.return_value = member
+    return bot
+
+
+class TestAcademyHandler:
+
+    async def test_account_linked_adds_the_academy_and_certificate_roles(self, bot, member, update_member_roles):
+        body = _body(WebhookEvent.ACCOUNT_LINKED, member, certifications=[{"id": CBBH}, {"id": CPTS}])
+
+        assert await academy.handler(body, bot) == {"success": True}
+
+        update_member_roles.assert_awaited_once_with(member, add={
+            settings.roles.ACADEMY_USER, settings.get_academy_cert_role(CBBH), settings.get_academy_cert_role(CPTS)
+        })
+
+    async def test_certificate_awarded_adds_the_certificate_role(self, bot, member, update_member_roles):
+        body = _body(WebhookEvent.CERTIFICATE_AWARDED, member, certification={"id": CBBH})
+
+        assert await academy.handler(body, bot) == {"success": True}
+
+        update_member_roles.assert_awaited_once_with(member, add={settings.get_academy_cert_role(CBBH)})
+
+    async def test_certificate_without_role_is_rejected(self, bot, member, update_member_roles):
+        body = _body(WebhookEvent.CERTIFICATE_AWARDED, member, certification={"id": 0})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await academy.handler(body, bot)
+
+        assert exc_info.value.status_code == 400
+        update_member_roles.assert_not_called()
+
+    async def test_account_unlinked_removes_the_academy_roles(self, bot, member, update_member_roles):
+        cert_role = helpers.MockRole(id=settings.get_academy_cert_role(CBBH))
+        member.roles = [helpers.MockRole(), cert_role]
+
+        assert await academy.handler(_body(WebhookEvent.ACCOUNT_UNLINKED, member), bot) == {"success": True}
+
+        update_member_roles.assert_awaited_once_with(member, remove={settings.roles.ACADEMY_USER, cert_role.id})
+
+    async def test_member_not_in_guild_is_rejected(self, bot, guild, member, update_member_roles):
+        guild.get_member.return_value = None
+        guild.fetch_member.side_effect = NotFound(mock.Mock(status=404, reason="Not Found"), "Unknown Member")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await academy.handler(_body(WebhookEvent.ACCOUNT_LINKED, member, certifications=[]), bot)
+
+        assert exc_info.value.status_code == 400
+        update_member_roles.assert_not_called()
+
+    async def test_unknown_event_is_not_implemented(self, bot, member, update_member_roles):
+        with pytest.raises(HTTPException) as exc_info:
+            await academy.handler(_body(WebhookEvent.RANK_UP, member), bot)
+
+        assert exc_info.value.status_code == 501
+        update_member_roles.assert_not_called()
+
+    async def test_failed_role_update_is_not_reported_as_success(self, bot, member, update_member_roles):
+        update_member_roles.side_effect = Forbidden(mock.Mock(status=403, reason="Forbidden"), "Missing Permissions")
+        body = _body(WebhookEvent.CERTIFICATE_AWARDED, member, certification={"id": CBBH})
+
+        with pytest.raises(Forbidden):
+            await academy.handler(body, bot)
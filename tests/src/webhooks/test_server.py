@@ -0,0 +1,82 @@
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException
+
+from src.webhooks import server
+from src.webhooks.types import Platform, WebhookBody, WebhookEvent
+
+
+def _body() -> WebhookBody:
+    return WebhookBody(platform=Platform.ACADEMY, event=WebhookEvent.ACCOUNT_LINKED, data={"discord_id": 1})
+
+
+class TestWebhookHandler:
+
+    async def test_valid_token_is_accepted(self):
+        handle = mock.AsyncMock(return_value={"success": True})
+
+        with (
+            mock.patch("src.webhooks.server._webhook_token", b"secret"),
+            mock.patch("src.webhooks.handlers.handle", handle),
+        ):
+            assert await server.webhook_handler(_body(), "Bearer secret") == {"success": True}
+
+        handle.assert_called_once()
+
+    @pytest.mark.parametrize("authorization", [None, "secret", "Bearer wrong"])
+    async def test_invalid_token_is_rejected(self, authorization):
+        with mock.patch("src.webhooks.server._webhook_token", b"secret"):
+            with pytest.raises(HTTPException) as exc_info:
+                await server.webhook_handler(_body(), authorization)
+
+        assert exc_info.value.status_code == 401
+
+    async def test_requests_are_rejected_without_configured_token(self):
+        with mock.patch("src.webhooks.server._webhook_token", b""):
+            with pytest.raises(HTTPException) as exc_info:
+                await server.webhook_handler(_body(), "Bearer ")
+
+        assert exc_info.value.status_code == 401
+
+
+def _receive(*chunks: bytes) -> mock.AsyncMock:
+    return mock.AsyncMock(side_effect=[
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1} for i, chunk in enumerate(chunks)
+    ])
+
+
+async def _read_body(scope, receive, send) -> None:
+    while (await receive())["more_body"]:
+        pass
+
+
+class TestBodySizeLimitMiddleware:
+
+    async def test_announced_large_body_is_rejected(self):
+        scope = {"type": "http", "headers": [(b"content-length", str(server.MAX_BODY_SIZE + 1).encode())]}
+        app, send = mock.AsyncMock(), mock.AsyncMock()
+
+        await server.BodySizeLimitMiddleware(app)(scope, _receive(b""), send)
+
+        assert send.call_args_list[0].args[0]["status"] == 413
+        app.assert_not_called()
+
+    async def test_small_body_is_passed_on(self):
+        scope = {"type": "http", "headers": [(b"content-length", b"128")]}
+        app = mock.AsyncMock(side_effect=_read_body)
+        receive = _receive(b"x" * 128)
+
+        await server.BodySizeLimitMiddleware(app)(scope, receive, mock.AsyncMock())
+
+        app.assert_called_once()
+        receive.assert_called_once()
+
+    async def test_large_body_without_content_length_is_rejected(self):
+        scope = {"type": "http", "headers": [(b"transfer-encoding", b"chunked")]}
+        receive = _receive(b"x" * server.MAX_BODY_SIZE, b"x")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await server.BodySizeLimitMiddleware(_read_body)(scope, receive, mock.AsyncMock())
+
+        assert exc_info.value.status_code == 413
@@ -177,6 +177,25 @@ class TestDiscordMocks:
             with pytest.raises(AttributeError):
                 bool(mock.this_does_not_exist)
 
+    def test_mocks_of_the_same_type_reuse_the_spec(self):
+        """Mocks of the same type should follow the same spec, including the additional async attributes."""
+        first = helpers.MockTextChannel()
+        second = helpers.MockTextChannel()
+
+        assert first._mock_methods == second._mock_methods
+        assert first._spec_asyncs == second._spec_asyncs
+        assert {"send", "edit"} <= second._spec_asyncs
+        with pytest.raises(AttributeError):
+            second.this_is_not_a_channel_attribute
+
+    def test_next_ids_reserves_unique_ids(self):
+        """`next_ids` should return consecutive ids which are not handed out to new mocks again."""
+        ids = helpers.MockRole.next_ids(3)
+        role = helpers.MockRole()
+
+        assert ids == list(range(ids[0], ids[0] + 3))
+        assert role.id > ids[-1]
+
     def test_mocks_use_mention_when_provided_as_kwarg(self):
         """The mock should use the passed `mention` instead of the default one if present."""
         test_cases = (